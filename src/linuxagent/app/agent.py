@@ -200,7 +200,7 @@ class LinuxAgent:
         if line.startswith("/"):
             self._pending_resume_thread_id = None
             return None
-        if not line.isdigit():
+        if not line.isdecimal():
             self._pending_resume_thread_id = None
             return None
         sessions = self.chat_service.list_sessions()
@@ -283,7 +283,7 @@ class LinuxAgent:
             return
         self.context_manager.replace(messages)
         self._persist_active_history(thread_id)
-        self.chat_service.save()
+        self.chat_service.save_session(thread_id)
 
 
 def _pending_history(history: list[Any], user_input: str) -> list[Any]:
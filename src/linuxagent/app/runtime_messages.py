@@ -49,10 +49,6 @@ def tool_activity_message(
     return None
 
 
-def command_event_key(event: dict[str, Any]) -> tuple[str, str]:
-    return (str(event.get("trace_id") or ""), str(event.get("command") or ""))
-
-
 def runtime_event_message(
     event: dict[str, Any], translator: Translator | None = None
 ) -> str | None:
@@ -545,4 +541,4 @@ def _json_preview_items(preview: str) -> list[str]:
         return []
     if not isinstance(value, list):
         return []
-    return [str(item).strip() for item in value if str(item).strip()]
+    return [text for item in value if (text := str(item).strip())]
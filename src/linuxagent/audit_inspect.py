@@ -94,6 +94,7 @@ def inspect_audit_log(
         policy_engine=policy_engine,
     )
     details = all_details[-limit:] if limit else ()
+    field_counts = _count_fields(records, ("decision", "safety_level"))
     return AuditInspection(
         path=path,
         verification=verification,
@@ -101,9 +102,9 @@ def inspect_audit_log(
         time_start=_time_at(records, 0),
         time_end=_time_at(records, -1),
         command_decision_count=_command_decision_count(records),
-        decision_counts=_count_field(records, "decision", _DECISION_KEYS),
-        safety_counts=_count_field(records, "safety_level", _SAFETY_KEYS),
-        command_event_count=sum(1 for _, record in records if _command(record) is not None),
+        decision_counts=_ordered_counts(field_counts["decision"], _DECISION_KEYS),
+        safety_counts=_ordered_counts(field_counts["safety_level"], _SAFETY_KEYS),
+        command_event_count=len(all_details),
         sensitive_command_event_count=sum(1 for detail in all_details if detail.sensitive),
         details=details,
     )
@@ -258,17 +259,17 @@ def _decisions_by_audit_id(records: tuple[tuple[int, JsonRecord], ...]) -> dict[
     return decisions
 
 
-def _count_field(
+def _count_fields(
     records: tuple[tuple[int, JsonRecord], ...],
-    field: str,
-    keys: tuple[str, ...],
-) -> dict[str, int]:
-    counter: Counter[str] = Counter()
+    fields: tuple[str, ...],
+) -> dict[str, Counter[str]]:
+    counters: dict[str, Counter[str]] = {field: Counter() for field in fields}
     for _, record in records:
-        value = _string_value(record.get(field))
-        if value:
-            counter[value] += 1
-    return _ordered_counts(counter, keys)
+        for field, counter in counters.items():
+            value = _string_value(record.get(field))
+            if value:
+                counter[value] += 1
+    return counters
 
 
 def _ordered_counts(counter: Counter[str], keys: tuple[str, ...]) -> dict[str, int]:
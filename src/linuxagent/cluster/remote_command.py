@@ -7,10 +7,12 @@ remote execution is intentionally narrower than local argv-based execution.
 
 from __future__ import annotations
 
+import re
 import shlex
 from dataclasses import dataclass
 
 _FORBIDDEN_CHARS: frozenset[str] = frozenset("\n\r;&|<>(){}$`\\")
+_FORBIDDEN_CHAR_RE = re.compile(f"[{re.escape(''.join(sorted(_FORBIDDEN_CHARS)))}]")
 _FORBIDDEN_TOKENS: frozenset[str] = frozenset(
     {
         "&&",
@@ -67,6 +69,6 @@ def _reject_shell_syntax(command: str, argv: tuple[str, ...]) -> None:
     for token in argv:
         if token in _FORBIDDEN_TOKENS:
             raise RemoteCommandError(f"remote shell operator is not allowed: {token}")
-        for char in token:
-            if char in _FORBIDDEN_CHARS:
-                raise RemoteCommandError(f"remote shell metacharacter is not allowed: {char}")
+        match = _FORBIDDEN_CHAR_RE.search(token)
+        if match is not None:
+            raise RemoteCommandError(f"remote shell metacharacter is not allowed: {match.group()}")
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import select
 import threading
 import time
 import weakref
@@ -26,20 +27,21 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, TypeVar
 
 import paramiko
 
 from ..config.models import ClusterConfig, ClusterHost
 from ..interfaces import ExecutionResult
 from ..telemetry import TelemetryRecorder
-from .remote_command import RemoteCommandError, validate_remote_command
+from .remote_command import RemoteCommand, RemoteCommandError, validate_remote_command
 from .remote_profile import build_remote_execution
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 _CHANNEL_READ_CHUNK_BYTES = 32768
 _SSH_POLL_INTERVAL_SECONDS = 0.05
+_SYSTEM_KNOWN_HOSTS = Path("~/.ssh/known_hosts")
 
 
 class SSHError(RuntimeError):
@@ -66,13 +68,62 @@ class SSHCommandTimeoutError(SSHError):
     """Remote command did not finish before ``cluster.timeout``."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RemoteCommandOutput:
     exit_code: int
     stdout: bytes
     stderr: bytes
 
 
+class _ReadOnlyHostKeys(paramiko.HostKeys):
+    """Parsed known_hosts shared between clients; every mutation is refused.
+
+    Copying entries into each client through ``HostKeys.update`` costs a
+    hashed-hostname lookup per entry, which is slower than the re-parse it
+    would replace, so clients share one frozen store instead.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self._frozen = False
+        super().__init__(filename)
+        self._frozen = True
+
+    def load(self, filename: str) -> None:
+        self._refuse_if_frozen()
+        super().load(filename)
+
+    def add(self, hostname: str, keytype: str, key: paramiko.PKey) -> None:
+        self._refuse_if_frozen()
+        super().add(hostname, keytype, key)
+
+    def __setitem__(self, hostname: str, entry: Any) -> None:
+        self._refuse_if_frozen()
+        super().__setitem__(hostname, entry)
+
+    def __delitem__(self, key: str) -> None:
+        self._refuse_if_frozen()
+        super().__delitem__(key)
+
+    def _refuse_if_frozen(self) -> None:
+        if self._frozen:
+            raise TypeError("shared known_hosts are read-only")
+
+
+class _SharedHostKeysClient(paramiko.SSHClient):
+    """SSHClient that verifies servers against pre-parsed read-only stores."""
+
+    def __init__(
+        self,
+        host_keys: _ReadOnlyHostKeys | None,
+        system_host_keys: _ReadOnlyHostKeys | None,
+    ) -> None:
+        super().__init__()
+        if host_keys is not None:
+            self._host_keys = host_keys
+        if system_host_keys is not None:
+            self._system_host_keys = system_host_keys
+
+
 class SSHManager:
     """Pooled SSH client factory + async ``execute`` helper.
 
@@ -93,7 +144,11 @@ class SSHManager:
             logger.warning("allow_unknown_hosts is ignored; SSH always uses RejectPolicy")
         self._telemetry = telemetry
         self._pool: dict[tuple[str, int, str], paramiko.SSHClient] = {}
+        self._host_locks: dict[tuple[str, int, str], threading.Lock] = {}
+        self._private_keys: dict[str, tuple[tuple[int, int | None], paramiko.PKey]] = {}
+        self._known_hosts: dict[str, tuple[int, _ReadOnlyHostKeys]] = {}
         self._lock = threading.Lock()
+        self._closed = False
         self._executor = ThreadPoolExecutor(
             max_workers=config.max_workers,
             thread_name_prefix="linuxagent-ssh",
@@ -116,6 +171,7 @@ class SSHManager:
 
     def _close_all(self) -> None:
         with self._lock:
+            self._closed = True
             for client in self._pool.values():
                 try:
                     client.close()
@@ -137,14 +193,7 @@ class SSHManager:
             remote_command = validate_remote_command(command)
         except RemoteCommandError as exc:
             raise SSHRemoteCommandError(str(exc)) from exc
-        if self._telemetry is not None and trace_id is not None:
-            with self._telemetry.span(
-                "ssh.execute",
-                trace_id=trace_id,
-                attributes={"host": host.name},
-            ):
-                return await self._run_blocking(self._execute_sync, host, remote_command.raw)
-        return await self._run_blocking(self._execute_sync, host, remote_command.raw)
+        return await self._execute_validated(host, remote_command, trace_id=trace_id)
 
     async def execute_many(
         self,
@@ -156,10 +205,12 @@ class SSHManager:
         """Fan out ``command`` across ``hosts`` concurrently, isolating failures."""
         host_list = list(hosts)
         try:
-            validate_remote_command(command)
+            remote_command = validate_remote_command(command)
         except RemoteCommandError as exc:
             return {host.name: SSHRemoteCommandError(str(exc)) for host in host_list}
-        tasks = [self.execute(host, command, trace_id=trace_id) for host in host_list]
+        tasks = [
+            self._execute_validated(host, remote_command, trace_id=trace_id) for host in host_list
+        ]
         gathered = await asyncio.gather(*tasks, return_exceptions=True)
         results: dict[str, ExecutionResult | SSHError] = {}
         for host, outcome in zip(host_list, gathered, strict=True):
@@ -173,9 +224,27 @@ class SSHManager:
 
     # -- Internals --------------------------------------------------------
 
-    def _execute_sync(self, host: ClusterHost, command: str) -> ExecutionResult:
+    async def _execute_validated(
+        self,
+        host: ClusterHost,
+        remote_command: RemoteCommand,
+        *,
+        trace_id: str | None,
+    ) -> ExecutionResult:
+        if self._telemetry is not None and trace_id is not None:
+            with self._telemetry.span(
+                "ssh.execute",
+                trace_id=trace_id,
+                attributes={"host": host.name},
+            ):
+                return await self._run_blocking(self._execute_remote_sync, host, remote_command)
+        return await self._run_blocking(self._execute_remote_sync, host, remote_command)
+
+    def _execute_remote_sync(
+        self, host: ClusterHost, remote_command: RemoteCommand
+    ) -> ExecutionResult:
+        command = remote_command.raw
         try:
-            remote_command = validate_remote_command(command)
             remote_execution = build_remote_execution(host, remote_command)
         except RemoteCommandError as exc:
             raise SSHRemoteCommandError(str(exc)) from exc
@@ -211,63 +280,139 @@ class SSHManager:
         )
 
     def _get_or_connect(self, host: ClusterHost) -> paramiko.SSHClient:
+        # The pool lock only guards dict access; the handshake itself runs
+        # under a per-host lock so fan-out connects to different hosts overlap.
         key = (host.hostname, host.port, host.username)
         with self._lock:
-            client = self._pool.get(key)
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+        with host_lock:
+            client = self._pooled_client(key)
             if client is not None:
-                if _is_alive(client):
-                    return client
-                try:
-                    client.close()
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("ignoring close error on dead pool entry: %s", exc)
-                del self._pool[key]
-
-            new_client = self._build_client()
-            try:
-                new_client.connect(
-                    hostname=host.hostname,
-                    port=host.port,
-                    username=host.username,
-                    key_filename=str(host.key_filename) if host.key_filename else None,
-                    timeout=self._config.timeout,
-                    allow_agent=True,
-                    look_for_keys=True,
-                )
-            except paramiko.BadHostKeyException as exc:
+                return client
+            new_client = self._connect(host)
+            with self._lock:
+                # close() may have drained the pool during the handshake; a
+                # client pooled after that would never be closed.
+                closed = self._closed
+                if not closed:
+                    self._pool[key] = new_client
+            if closed:
                 new_client.close()
-                raise SSHUnknownHostError(f"host key mismatch for {host.hostname}: {exc}") from exc
-            except paramiko.AuthenticationException as exc:
-                new_client.close()
-                raise SSHAuthError(
-                    f"authentication failed for {host.username}@{host.hostname}: {exc}"
-                ) from exc
-            except (paramiko.SSHException, OSError) as exc:
-                new_client.close()
-                # paramiko raises SSHException for unknown hosts under RejectPolicy.
-                message = str(exc)
-                if (
-                    "not found in known_hosts" in message
-                    or isinstance(exc, paramiko.SSHException)
-                    and "Server" in message
-                    and "not found" in message
-                ):
-                    raise SSHUnknownHostError(f"unknown host {host.hostname}: {exc}") from exc
-                raise SSHConnectionError(f"failed to connect to {host.hostname}: {exc}") from exc
-
-            self._pool[key] = new_client
+                raise SSHConnectionError(f"ssh manager closed while connecting to {host.hostname}")
             _enable_keepalive(new_client, timeout_seconds=self._config.timeout)
             return new_client
 
+    def _pooled_client(self, key: tuple[str, int, str]) -> paramiko.SSHClient | None:
+        with self._lock:
+            client = self._pool.get(key)
+            if client is None or _is_alive(client):
+                return client
+            del self._pool[key]
+        try:
+            client.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("ignoring close error on dead pool entry: %s", exc)
+        return None
+
+    def _connect(self, host: ClusterHost) -> paramiko.SSHClient:
+        pkey = self._private_key(host.key_filename)
+        key_filename = str(host.key_filename) if host.key_filename and pkey is None else None
+        new_client = self._build_client()
+        try:
+            new_client.connect(
+                hostname=host.hostname,
+                port=host.port,
+                username=host.username,
+                pkey=pkey,
+                key_filename=key_filename,
+                timeout=self._config.timeout,
+                allow_agent=True,
+                look_for_keys=True,
+            )
+        except paramiko.BadHostKeyException as exc:
+            new_client.close()
+            raise SSHUnknownHostError(f"host key mismatch for {host.hostname}: {exc}") from exc
+        except paramiko.AuthenticationException as exc:
+            new_client.close()
+            raise SSHAuthError(
+                f"authentication failed for {host.username}@{host.hostname}: {exc}"
+            ) from exc
+        except (paramiko.SSHException, OSError) as exc:
+            new_client.close()
+            # paramiko raises SSHException for unknown hosts under RejectPolicy.
+            message = str(exc)
+            if (
+                "not found in known_hosts" in message
+                or isinstance(exc, paramiko.SSHException)
+                and "Server" in message
+                and "not found" in message
+            ):
+                raise SSHUnknownHostError(f"unknown host {host.hostname}: {exc}") from exc
+            raise SSHConnectionError(f"failed to connect to {host.hostname}: {exc}") from exc
+        return new_client
+
+    def _private_key(self, path: Path | None) -> paramiko.PKey | None:
+        """Return the parsed key at ``path``, cached until it or its cert changes.
+
+        ``PKey.from_path`` also loads ``<key>-cert.pub``, so a renewed
+        short-lived certificate must invalidate the cached key too. Encrypted
+        or unreadable keys return ``None`` so paramiko falls back to its own
+        ``key_filename`` handling (agent, error reporting).
+        """
+        if path is None:
+            return None
+        try:
+            version = _key_file_version(path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._private_keys.get(str(path))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        try:
+            pkey = paramiko.PKey.from_path(path)
+        except (
+            OSError,
+            TypeError,
+            ValueError,
+            paramiko.SSHException,
+            paramiko.pkey.UnknownKeyType,
+        ) as exc:
+            # Encrypted PEM keys raise TypeError ("Password was not given ...").
+            logger.debug("deferring key %s to paramiko: %s", path, exc)
+            return None
+        with self._lock:
+            self._private_keys[str(path)] = (version, pkey)
+        return pkey
+
     def _build_client(self) -> paramiko.SSHClient:
-        client = paramiko.SSHClient()
-        known_hosts = Path(self._config.known_hosts_path)
-        if known_hosts.is_file():
-            client.load_host_keys(str(known_hosts))
-        client.load_system_host_keys()
+        # RejectPolicy never adds keys, so parsed known_hosts can be shared
+        # read-only between clients instead of re-parsed on every connect.
+        client = _SharedHostKeysClient(
+            self._parsed_host_keys(Path(self._config.known_hosts_path)),
+            self._parsed_host_keys(_SYSTEM_KNOWN_HOSTS.expanduser()),
+        )
         client.set_missing_host_key_policy(paramiko.RejectPolicy())
         return client
 
+    def _parsed_host_keys(self, path: Path) -> _ReadOnlyHostKeys | None:
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        cache_key = str(path)
+        with self._lock:
+            cached = self._known_hosts.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            host_keys = _ReadOnlyHostKeys(cache_key)
+        except OSError:
+            return None
+        with self._lock:
+            self._known_hosts[cache_key] = (mtime_ns, host_keys)
+        return host_keys
+
     async def _run_blocking(self, func: Callable[..., T], *args: object) -> T:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(self._executor, partial(func, *args))
@@ -283,6 +428,14 @@ class SSHManager:
             logger.debug("ignoring close error on discarded client: %s", exc)
 
 
+def _key_file_version(path: Path) -> tuple[int, int | None]:
+    try:
+        cert_mtime: int | None = path.with_name(f"{path.name}-cert.pub").stat().st_mtime_ns
+    except FileNotFoundError:
+        cert_mtime = None
+    return (path.stat().st_mtime_ns, cert_mtime)
+
+
 def _is_alive(client: paramiko.SSHClient) -> bool:
     transport = client.get_transport()
     return transport is not None and transport.is_active()
@@ -319,7 +472,9 @@ def _collect_remote_command_output(
             break
         _raise_if_deadline_expired(channel, host, command, deadline, timeout_seconds)
         if not drained:
-            time.sleep(min(_SSH_POLL_INTERVAL_SECONDS, max(0.0, deadline - time.monotonic())))
+            _wait_for_channel(
+                channel, min(_SSH_POLL_INTERVAL_SECONDS, max(0.0, deadline - time.monotonic()))
+            )
     exit_code = channel.recv_exit_status()
     _drain_channel(
         channel,
@@ -333,6 +488,20 @@ def _collect_remote_command_output(
     return _RemoteCommandOutput(exit_code=exit_code, stdout=bytes(stdout), stderr=bytes(stderr))
 
 
+def _wait_for_channel(channel: paramiko.Channel, seconds: float) -> None:
+    """Block until the channel signals new data/EOF, or ``seconds`` elapse.
+
+    Paramiko exposes a selectable pipe per channel, so the wait returns as
+    soon as output arrives instead of always sleeping a full poll interval.
+    Exit status and stderr do not trip the pipe, which is why the wait stays
+    bounded by the poll interval.
+    """
+    try:
+        select.select([channel], [], [], seconds)
+    except (AttributeError, OSError, TypeError, ValueError):
+        time.sleep(seconds)
+
+
 def _drain_channel(
     channel: paramiko.Channel,
     *,
@@ -32,6 +32,8 @@ logger = logging.getLogger(__name__)
 _ENV_CONFIG_VAR = "LINUXAGENT_CONFIG"
 _XDG_PATH = Path.home() / ".config" / "linuxagent" / "config.yaml"
 _REQUIRED_MODE = 0o600
+# libyaml-backed loader when PyYAML was built with it; same safe constructor set.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 PathKey = tuple[str | int, ...]
 
 
@@ -57,20 +59,21 @@ def load_config(
     """
     effective_env = os.environ if env is None else env
     merged: dict[str, Any] = {}
-    line_map: dict[PathKey, int] = {}
+    merged_texts: list[str] = []
 
     for source_path, requires_secure in _resolve_sources(cli_path=cli_path, env=effective_env):
         if requires_secure:
             _verify_secure(source_path)
-        data, source_lines = _load_yaml(source_path)
+        data, text = _load_yaml(source_path)
         if data is not None:
             _deep_merge(merged, data)
-            line_map.update(source_lines)
+            merged_texts.append(text)
             logger.debug("merged config from %s", source_path)
 
     try:
         return AppConfig.model_validate(merged)
     except ValidationError as exc:
+        line_map = _merged_line_map(merged_texts)
         raise ConfigError(_format_validation_error(exc, line_map)) from exc
 
 
@@ -160,23 +163,22 @@ def _current_uid() -> int | None:
     return getuid() if getuid is not None else None
 
 
-def _load_yaml(path: Path) -> tuple[dict[str, Any] | None, dict[PathKey, int]]:
+def _load_yaml(path: Path) -> tuple[dict[str, Any] | None, str]:
     try:
         text = path.read_text(encoding="utf-8")
     except OSError as exc:
         raise ConfigError(f"cannot read {path}: {exc}") from exc
 
-    line_map = _extract_line_map(text)
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(text, Loader=_YAML_SAFE_LOADER)  # noqa: S506  # nosec B506
     except yaml.YAMLError as exc:
         raise ConfigError(f"invalid YAML in {path}: {exc}") from exc
 
     if data is None:
-        return None, line_map
+        return None, text
     if not isinstance(data, dict):
         raise ConfigError(f"{path}: top-level YAML must be a mapping, got {type(data).__name__}")
-    return data, line_map
+    return data, text
 
 
 def _deep_merge(base: dict[str, Any], overlay: Mapping[str, Any]) -> None:
@@ -209,6 +211,14 @@ def _render_error_input(err: Mapping[str, Any]) -> str:
     return repr(err.get("input"))
 
 
+def _merged_line_map(texts: list[str]) -> dict[PathKey, int]:
+    """Map config paths to source lines; only built when validation fails."""
+    line_map: dict[PathKey, int] = {}
+    for text in texts:
+        line_map.update(_extract_line_map(text))
+    return line_map
+
+
 def _extract_line_map(text: str) -> dict[PathKey, int]:
     try:
         root = yaml.compose(text)
@@ -8,6 +8,7 @@ avoided (R-ARCH-05). The container is instantiated once per process in
 
 from __future__ import annotations
 
+import atexit
 import logging
 from collections.abc import Callable
 from pathlib import Path
@@ -17,7 +18,7 @@ from langchain_core.tools import BaseTool
 
 from .active_view import ActiveTurnView, ActiveWorkItemView, apply_event
 from .app import LinuxAgent
-from .app.runtime_messages import command_event_key, runtime_event_message, tool_activity_message
+from .app.runtime_messages import runtime_event_message, tool_activity_message
 from .app.runtime_telemetry import record_runtime_event
 from .audit import AuditLog
 from .audit_sink import HttpAuditSink
@@ -89,9 +90,11 @@ class Container:
 
     def __init__(self, config: AppConfig, *, config_path: Path | None = None) -> None:
         self._config = config
+        self._track_memory_pollution = (
+            config.memory.enabled and config.memory.disable_on_external_context
+        )
         self._config_path = config_path
         self._singletons: dict[str, object] = {}
-        self._streamed_outputs: set[tuple[str, str]] = set()
         self._last_activity_message = ""
         self._active_turn_view = ActiveTurnView()
         self._turn_history_summaries: list[TurnHistorySummary] = []
@@ -307,7 +310,8 @@ class Container:
     def learner(self) -> CommandLearner:
         def factory() -> CommandLearner:
             learner = CommandLearner(Path.home() / ".linuxagent_learner.json")
-            learner.load()
+            learner.defer_load()
+            atexit.register(_flush_learner_at_exit, learner)
             return learner
 
         return self._cached("learner", factory)
@@ -498,14 +502,11 @@ class Container:
             stream = event.get("phase")
             if stream in {"stdout", "stderr"}:
                 text = str(event.get("text") or "")
-                if text:
-                    self._streamed_outputs.add(command_event_key(event))
                 await self.ui().print_raw(text, stderr=stream == "stderr")
                 return
             if stream == "result":
                 result = event.get("result")
                 if isinstance(result, ExecutionResult):
-                    self._streamed_outputs.discard(command_event_key(event))
                     printer = getattr(self.ui(), "print_execution_result", None)
                     if callable(printer):
                         await printer(result, include_output=False)
@@ -513,7 +514,7 @@ class Container:
         return observe
 
     def _mark_memory_pollution_from_event(self, event: dict[str, Any]) -> None:
-        if not self._config.memory.enabled or not self._config.memory.disable_on_external_context:
+        if not self._track_memory_pollution:
             return
         thread_id = _event_thread_id(event)
         if not thread_id:
@@ -579,6 +580,13 @@ class Container:
         return cast(_T, value)
 
 
+def _flush_learner_at_exit(learner: CommandLearner) -> None:
+    try:
+        learner.flush()
+    except (OSError, ValueError) as exc:
+        logging.getLogger(__name__).warning("could not save command learner stats: %s", exc)
+
+
 def _active_runtime_event(event: dict[str, Any]) -> bool:
     if event.get("schema_version") != 1:
         return False
@@ -47,7 +47,7 @@ class TurnEventReplay:
         runtime_event = _runtime_event(event)
         if runtime_event is None:
             return self
-        events = (*self.events, runtime_event)[-MAX_REPLAY_EVENTS:]
+        events = _bounded_append(self.events, runtime_event)
         view = apply_event(self.active_view, runtime_event)
         return replace(
             self, events=events, active_view=view, history=consolidate_turn_history(view)
@@ -104,6 +104,14 @@ class RuntimeEventStore:
             del self._streams[key]
 
 
+def _bounded_append(
+    events: tuple[RuntimeEvent, ...], event: RuntimeEvent
+) -> tuple[RuntimeEvent, ...]:
+    if len(events) < MAX_REPLAY_EVENTS:
+        return (*events, event)
+    return (*events[len(events) - MAX_REPLAY_EVENTS + 1 :], event)
+
+
 def _runtime_event(event: RuntimeEvent | dict[str, Any]) -> RuntimeEvent | None:
     if isinstance(event, RuntimeEvent):
         return event
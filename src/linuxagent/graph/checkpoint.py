@@ -13,19 +13,39 @@ from typing import Any
 from langgraph.checkpoint.memory import MemorySaver
 
 TypedBytes = tuple[str, bytes]
+_JOURNAL_COMPACT_ENTRIES = 64
 
 
 class PersistentMemorySaver(MemorySaver):  # type: ignore[misc, unused-ignore]
-    """MemorySaver with an on-disk mirror for process-to-process resume."""
+    """MemorySaver with an on-disk mirror for process-to-process resume.
+
+    New checkpoints and writes are appended to a JSON Lines journal next to the
+    store; the full store is rewritten only when the journal grows long or a
+    thread is deleted.
+    """
 
     def __init__(self, path: Path) -> None:
         super().__init__()
         self.path = path.expanduser()
+        self.journal_path = self.path.with_name(f"{self.path.name}.journal")
+        self._journal_entries = 0
         self._load()
 
     def put(self, config: Any, checkpoint: Any, metadata: Any, new_versions: Any) -> Any:
         result = super().put(config, checkpoint, metadata, new_versions)
-        self._persist()
+        configurable = result["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+        item = self.storage[thread_id][checkpoint_ns][checkpoint_id]
+        blob_keys = [(thread_id, checkpoint_ns, key, value) for key, value in new_versions.items()]
+        blobs = {key: self.blobs[key] for key in blob_keys if key in self.blobs}
+        self._append_journal(
+            {
+                "storage": _dump_storage({thread_id: {checkpoint_ns: {checkpoint_id: item}}}),
+                "blobs": _dump_blobs(blobs),
+            }
+        )
         return result
 
     def put_writes(
@@ -36,21 +56,53 @@ class PersistentMemorySaver(MemorySaver):  # type: ignore[misc, unused-ignore]
         task_path: str = "",
     ) -> None:
         super().put_writes(config, writes, task_id, task_path)
-        self._persist()
+        configurable = config["configurable"]
+        outer_key = (
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns", ""),
+            configurable["checkpoint_id"],
+        )
+        self._append_journal({"writes": _dump_writes({outer_key: self.writes.get(outer_key, {})})})
 
     def delete_thread(self, thread_id: str) -> None:
         super().delete_thread(thread_id)
         self._persist()
 
     def _load(self) -> None:
-        if not self.path.is_file():
+        if self.path.is_file():
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            if raw.get("version") != 1:
+                raise ValueError(f"unsupported checkpoint store version: {self.path}")
+            self.storage = _load_storage(raw.get("storage", []))
+            self.writes = _load_writes(raw.get("writes", []))
+            self.blobs = _load_blobs(raw.get("blobs", []))
+        if self.journal_path.is_file():
+            self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        for line in self.journal_path.read_text(encoding="utf-8").splitlines():
+            loaded = _load_journal_entry(line)
+            if loaded is None:
+                continue
+            storage, writes, blobs = loaded
+            for thread_id, namespaces in storage.items():
+                for checkpoint_ns, checkpoints in namespaces.items():
+                    self.storage[thread_id][checkpoint_ns].update(checkpoints)
+            for outer_key, inner_writes in writes.items():
+                self.writes[outer_key].update(inner_writes)
+            self.blobs.update(blobs)
+            self._journal_entries += 1
+
+    def _append_journal(self, entry: dict[str, Any]) -> None:
+        if not self.path.is_file() or self._journal_entries >= _JOURNAL_COMPACT_ENTRIES:
+            self._persist()
             return
-        raw = json.loads(self.path.read_text(encoding="utf-8"))
-        if raw.get("version") != 1:
-            raise ValueError(f"unsupported checkpoint store version: {self.path}")
-        self.storage = _load_storage(raw.get("storage", []))
-        self.writes = _load_writes(raw.get("writes", []))
-        self.blobs = _load_blobs(raw.get("blobs", []))
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        fd = os.open(self.journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        with os.fdopen(fd, "a", encoding="utf-8") as file:
+            file.write(line)
+        os.chmod(self.journal_path, 0o600)
+        self._journal_entries += 1
 
     def _persist(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -63,6 +115,22 @@ class PersistentMemorySaver(MemorySaver):  # type: ignore[misc, unused-ignore]
         tmp_path = _write_temp_checkpoint(self.path, payload)
         os.replace(tmp_path, self.path)
         os.chmod(self.path, 0o600)
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_entries = 0
+
+
+def _load_journal_entry(line: str) -> tuple[Any, Any, dict[Any, Any]] | None:
+    try:
+        entry = json.loads(line)
+        if not isinstance(entry, dict):
+            return None
+        return (
+            _load_storage(entry.get("storage", [])),
+            _load_writes(entry.get("writes", [])),
+            _load_blobs(entry.get("blobs", [])),
+        )
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
 
 
 def _write_temp_checkpoint(path: Path, payload: dict[str, Any]) -> Path:
@@ -24,15 +24,19 @@ def updated_command_permissions(
         return existing
     candidates = _plan_commands(state) if allow_all else _current_command(state)
     allowed = list(existing)
+    seen = set(allowed)
     for command in candidates:
+        key = normalize_command(command)
+        if key is None or key in seen:
+            continue
         verdict = command_service.classify(command, source=CommandSource.LLM)
         if verdict.level is SafetyLevel.BLOCK or not verdict.can_whitelist:
             continue
         if has_destructive_capability(verdict.capabilities):
             continue
-        key = normalize_command(command)
-        if key is not None and key not in allowed and not _permission_exists(allowed, command):
+        if not _permission_exists(allowed, command):
             allowed.append(key)
+            seen.add(key)
     return tuple(allowed)
 
 
@@ -142,7 +142,7 @@ def _selected_files(response: Any) -> tuple[str, ...] | None:
     raw = response.get("selected_files")
     if not isinstance(raw, list | tuple):
         return ()
-    return tuple(str(item).strip() for item in raw if str(item).strip())
+    return tuple(text for item in raw if (text := str(item).strip()))
 
 
 def _confirmed_patch_update(
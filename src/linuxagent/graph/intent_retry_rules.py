@@ -6,6 +6,23 @@ import re
 
 from ..plans import DirectAnswerPlan, FilePatchPlan
 
+_ARTIFACT_ACTION_RE = re.compile(
+    r"(\u5199|\u751f\u6210|\u521b\u5efa|\u65b0\u5efa|"
+    r"\u505a\u4e00\u4e2a|make|create|write|generate)"
+)
+_ARTIFACT_KIND_RE = re.compile(
+    r"(\u811a\u672c|\u7a0b\u5e8f|\u4ee3\u7801|\u6587\u4ef6|"
+    r"\u914d\u7f6e|playbook|script|program|code|file|config)"
+)
+_DESTINATION_PATH_RE = re.compile(r"(^|\s|['\"])(?:/|~|\.)[^\s'\"\u3002\uff0c\uff1b;]*")
+_DESTINATION_ZH_RE = re.compile(r"(\u653e\u5728|\u4fdd\u5b58\u5230|\u76ee\u5f55|\u8def\u5f84)")
+_DESTINATION_EN_RE = re.compile(r"\b(path|directory|folder|under|save (?:it )?to)\b")
+_NUMBERED_QUESTION_RE = re.compile(
+    r"(?m)^\s*(?:[-*\u2022]\s*)?"
+    r"(?:\d+[\s.)\u3001]|[\u4e00\u4e8c\u4e09\u56db\u4e94"
+    r"\u516d\u4e03\u516b\u4e5d\u5341]+[\u3001.])\s*.+(?:\?|\uff1f)"
+)
+
 
 def planner_direct_answer_retry_error(user_text: str, plan: DirectAnswerPlan) -> str | None:
     if not _artifact_creation_requires_plan(user_text, plan.answer):
@@ -49,36 +66,21 @@ def _artifact_creation_requires_plan(user_text: str, answer: str) -> bool:
 
 def _looks_like_artifact_creation_request(user_text: str) -> bool:
     text = user_text.casefold()
-    action = re.search(
-        r"(\u5199|\u751f\u6210|\u521b\u5efa|\u65b0\u5efa|"
-        r"\u505a\u4e00\u4e2a|make|create|write|generate)",
-        text,
-    )
-    artifact = re.search(
-        r"(\u811a\u672c|\u7a0b\u5e8f|\u4ee3\u7801|\u6587\u4ef6|"
-        r"\u914d\u7f6e|playbook|script|program|code|file|config)",
-        text,
-    )
+    action = _ARTIFACT_ACTION_RE.search(text)
+    artifact = _ARTIFACT_KIND_RE.search(text)
     return action is not None and artifact is not None
 
 
 def _mentions_artifact_destination(user_text: str) -> bool:
     text = user_text.casefold()
     return bool(
-        re.search(r"(^|\s|['\"])(?:/|~|\.)[^\s'\"\u3002\uff0c\uff1b;]*", text)
-        or re.search(r"(\u653e\u5728|\u4fdd\u5b58\u5230|\u76ee\u5f55|\u8def\u5f84)", text)
-        or re.search(r"\b(path|directory|folder|under|save (?:it )?to)\b", text)
+        _DESTINATION_PATH_RE.search(text)
+        or _DESTINATION_ZH_RE.search(text)
+        or _DESTINATION_EN_RE.search(text)
     )
 
 
 def _question_count(text: str) -> int:
     punctuation_count = text.count("?") + text.count("？")
-    numbered_question_count = len(
-        re.findall(
-            r"(?m)^\s*(?:[-*\u2022]\s*)?"
-            r"(?:\d+[\s.)\u3001]|[\u4e00\u4e8c\u4e09\u56db\u4e94"
-            r"\u516d\u4e03\u516b\u4e5d\u5341]+[\u3001.])\s*.+(?:\?|\uff1f)",
-            text,
-        )
-    )
+    numbered_question_count = len(_NUMBERED_QUESTION_RE.findall(text))
     return max(punctuation_count, numbered_question_count)
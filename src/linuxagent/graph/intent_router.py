@@ -21,6 +21,37 @@ from ..user_input import (
 )
 from .llm_calls import complete_llm
 
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+_ARTIFACT_ACTION_RE = re.compile(
+    r"(\u5199|\u7f16\u5199|\u751f\u6210|\u521b\u5efa|\u65b0\u5efa|"
+    r"\u505a\u4e00\u4e2a|make|create|write|generate)"
+)
+_ARTIFACT_KIND_RE = re.compile(
+    r"(\u811a\u672c|\u7a0b\u5e8f|\u4ee3\u7801|\u6587\u4ef6|"
+    r"\u914d\u7f6e|playbook|script|program|code|file|config)"
+)
+_DELEGATED_CHOICE_RE = re.compile(
+    r"(\u968f\u4fbf|\u4f60\u51b3\u5b9a|\u4f60\u770b\u7740\u529e|"
+    r"\u4efb\u610f|\u6d4b\u8bd5\u4e00\u4e0b\u4f60\u7684\u80fd\u529b|"
+    r"\b(?:whatever|any|your choice|you decide|up to you)\b)"
+)
+_SAFETY_CRITICAL_DESTINATION_RE = re.compile(
+    r"(\b(?:prod|production|remote|server|cluster|system|root|sudo|"
+    r"/etc|/usr|/var|/opt)\b|\u751f\u4ea7|\u8fdc\u7a0b|\u670d\u52a1\u5668|"
+    r"\u96c6\u7fa4|\u7cfb\u7edf\u76ee\u5f55|\u6839\u76ee\u5f55)"
+)
+_INCIDENTAL_TERMS_RE = re.compile(
+    r"\u8def\u5f84|\u4fdd\u5b58|\u653e\u5728|\u6587\u4ef6\u540d|"
+    r"\u76ee\u5f55|\u8bed\u8a00|\u8303\u56f4|\u529f\u80fd|"
+    r"path|filename|file name|directory|folder|save|language|scope|function"
+)
+_SAFETY_TERMS_RE = re.compile(
+    r"\u751f\u4ea7|\u8fdc\u7a0b|\u670d\u52a1\u5668|\u96c6\u7fa4|"
+    r"\u8986\u76d6|\u5220\u9664|\u6743\u9650|"
+    r"production|remote|server|cluster|overwrite|delete|permission"
+)
+_ZH_OVERWRITE_CLAUSE_RE = re.compile(r"[^\uff0c,\u3002.!?\uff1f]*\u8986\u76d6[^?\uff1f\u3002.!]*")
+_EN_OVERWRITE_CLAUSE_RE = re.compile(r"[^,.!?]*to avoid overwrit(?:e|ing)[^?!.]*")
 _PARALLEL_TASK_EXECUTION_KEYS = frozenset(
     {
         "command",
@@ -133,7 +164,7 @@ def _strip_json_fence(raw: str) -> str:
     stripped = raw.strip()
     if stripped.startswith("{"):
         return stripped
-    match = re.fullmatch(r"```(?:json)?\s*(\{.*\})\s*```", stripped, flags=re.DOTALL)
+    match = _JSON_FENCE_RE.fullmatch(stripped)
     return match.group(1) if match else stripped
 
 
@@ -254,39 +285,17 @@ def _delegates_incidental_artifact_choices(user_text: str) -> bool:
 
 
 def _looks_like_artifact_creation_request(text: str) -> bool:
-    action = re.search(
-        r"(\u5199|\u7f16\u5199|\u751f\u6210|\u521b\u5efa|\u65b0\u5efa|"
-        r"\u505a\u4e00\u4e2a|make|create|write|generate)",
-        text,
-    )
-    artifact = re.search(
-        r"(\u811a\u672c|\u7a0b\u5e8f|\u4ee3\u7801|\u6587\u4ef6|"
-        r"\u914d\u7f6e|playbook|script|program|code|file|config)",
-        text,
-    )
+    action = _ARTIFACT_ACTION_RE.search(text)
+    artifact = _ARTIFACT_KIND_RE.search(text)
     return action is not None and artifact is not None
 
 
 def _delegates_choice_to_agent(text: str) -> bool:
-    return bool(
-        re.search(
-            r"(\u968f\u4fbf|\u4f60\u51b3\u5b9a|\u4f60\u770b\u7740\u529e|"
-            r"\u4efb\u610f|\u6d4b\u8bd5\u4e00\u4e0b\u4f60\u7684\u80fd\u529b|"
-            r"\b(?:whatever|any|your choice|you decide|up to you)\b)",
-            text,
-        )
-    )
+    return _DELEGATED_CHOICE_RE.search(text) is not None
 
 
 def _requires_safety_critical_destination(text: str) -> bool:
-    return bool(
-        re.search(
-            r"(\b(?:prod|production|remote|server|cluster|system|root|sudo|"
-            r"/etc|/usr|/var|/opt)\b|\u751f\u4ea7|\u8fdc\u7a0b|\u670d\u52a1\u5668|"
-            r"\u96c6\u7fa4|\u7cfb\u7edf\u76ee\u5f55|\u6839\u76ee\u5f55)",
-            text,
-        )
-    )
+    return _SAFETY_CRITICAL_DESTINATION_RE.search(text) is not None
 
 
 def _asks_only_incidental_artifact_choices(answer: str) -> bool:
@@ -294,23 +303,13 @@ def _asks_only_incidental_artifact_choices(answer: str) -> bool:
         return False
     text = answer.casefold()
     safety_text = _drop_overwrite_avoidance_reason(text)
-    incidental_terms = (
-        r"\u8def\u5f84|\u4fdd\u5b58|\u653e\u5728|\u6587\u4ef6\u540d|"
-        r"\u76ee\u5f55|\u8bed\u8a00|\u8303\u56f4|\u529f\u80fd|"
-        r"path|filename|file name|directory|folder|save|language|scope|function"
-    )
-    if not re.search(incidental_terms, text):
+    if not _INCIDENTAL_TERMS_RE.search(text):
         return False
-    safety_terms = (
-        r"\u751f\u4ea7|\u8fdc\u7a0b|\u670d\u52a1\u5668|\u96c6\u7fa4|"
-        r"\u8986\u76d6|\u5220\u9664|\u6743\u9650|"
-        r"production|remote|server|cluster|overwrite|delete|permission"
-    )
-    return re.search(safety_terms, safety_text) is None
+    return _SAFETY_TERMS_RE.search(safety_text) is None
 
 
 def _drop_overwrite_avoidance_reason(text: str) -> str:
     # Drop the whole clause whose point is avoiding overwrite (e.g. "避免覆盖…",
     # "确保不会覆盖…"); the incidental-artifact path question is what matters.
-    text = re.sub(r"[^\uff0c,\u3002.!?\uff1f]*\u8986\u76d6[^?\uff1f\u3002.!]*", "", text)
-    return re.sub(r"[^,.!?]*to avoid overwrit(?:e|ing)[^?!.]*", "", text)
+    text = _ZH_OVERWRITE_CLAUSE_RE.sub("", text)
+    return _EN_OVERWRITE_CLAUSE_RE.sub("", text)
@@ -52,7 +52,7 @@ class SafetyResult:
             object.__setattr__(self, "matched_rules", (self.matched_rule,))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     command: str
     exit_code: int
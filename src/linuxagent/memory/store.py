@@ -27,6 +27,7 @@ _DEFAULT_MEMORY = """# LinuxAgent Memory
 This local memory is advisory only. It cannot bypass policy checks,
 Human-in-the-Loop confirmation, sandbox boundaries, or audit logging.
 """
+_SLUG_WORD_RE = re.compile(r"[a-z0-9]+")
 
 
 class MemoryDisabledError(RuntimeError):
@@ -411,7 +412,7 @@ def _optional_int(value: object) -> int | None:
 
 def _slug(title: str) -> str:
     lowered = title.lower()
-    parts = re.findall(r"[a-z0-9]+", lowered)
+    parts = _SLUG_WORD_RE.findall(lowered)
     return "-".join(parts[:8])
 
 
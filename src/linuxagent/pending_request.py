@@ -93,6 +93,13 @@ PENDING_REQUEST_MAPPINGS: tuple[PendingRequestMapping, ...] = (
         fallback="cancel_request",
     ),
 )
+_MAPPINGS_BY_REQUEST_TYPE = {mapping.request_type: mapping for mapping in PENDING_REQUEST_MAPPINGS}
+_LEGACY_REQUEST_MAPPINGS = tuple(
+    mapping for mapping in PENDING_REQUEST_MAPPINGS if mapping.legacy_payload_type
+)
+_MAPPINGS_BY_LEGACY_PAYLOAD_TYPE = {
+    mapping.legacy_payload_type: mapping for mapping in _LEGACY_REQUEST_MAPPINGS
+}
 
 
 def _request_id() -> str:
@@ -274,22 +281,11 @@ def pending_request_runtime_event(
 
 
 def request_mapping_for_type(request_type: str) -> PendingRequestMapping | None:
-    return next(
-        (mapping for mapping in PENDING_REQUEST_MAPPINGS if mapping.request_type == request_type),
-        None,
-    )
+    return _MAPPINGS_BY_REQUEST_TYPE.get(request_type)
 
 
 def request_mapping_for_legacy_payload(payload: Mapping[str, Any]) -> PendingRequestMapping | None:
-    payload_type = _payload_type(payload)
-    return next(
-        (
-            mapping
-            for mapping in legacy_request_mappings()
-            if mapping.legacy_payload_type == payload_type
-        ),
-        None,
-    )
+    return _MAPPINGS_BY_LEGACY_PAYLOAD_TYPE.get(_payload_type(payload))
 
 
 def request_mapping_for_interrupt(payload: Mapping[str, Any]) -> PendingRequestMapping | None:
@@ -300,7 +296,7 @@ def request_mapping_for_interrupt(payload: Mapping[str, Any]) -> PendingRequestM
 
 
 def legacy_request_mappings() -> tuple[PendingRequestMapping, ...]:
-    return tuple(mapping for mapping in PENDING_REQUEST_MAPPINGS if mapping.legacy_payload_type)
+    return _LEGACY_REQUEST_MAPPINGS
 
 
 def is_known_request_type(request_type: str) -> bool:
@@ -20,6 +20,7 @@ _SENSITIVE_REDIRECT_PATHS: tuple[str, ...] = (
     r"^/dev/nvme\d",
     r"^/home/[^/]+/\.ssh(/|$)",
 )
+_SENSITIVE_REDIRECT_RE = re.compile("|".join(f"(?:{path})" for path in _SENSITIVE_REDIRECT_PATHS))
 
 
 def decision_from_matches(matches: list[PolicyRule], source: CommandSource) -> PolicyDecision:
@@ -183,9 +184,7 @@ def _structural_decision(
 
 def _is_sensitive_redirect_target(target: str) -> bool:
     return any(
-        re.match(pattern, candidate)
-        for candidate in path_match_candidates(target)
-        for pattern in _SENSITIVE_REDIRECT_PATHS
+        _SENSITIVE_REDIRECT_RE.match(candidate) for candidate in path_match_candidates(target)
     )
 
 
@@ -10,6 +10,7 @@ from ..i18n import CatalogError, Translator, default_translator
 _POLICY_REASON_PREFIX = "policy.reason."
 _POLICY_REASON_TEXT_PREFIX = "policy.reason_text."
 _REASON_PART_SEPARATOR = "; "
+_REASON_KEY_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
 
 
 def policy_display_reason(
@@ -58,5 +59,5 @@ def _localized_reason_text(reason: str | None, translator: Translator) -> str |
 
 
 def _reason_key(reason: str) -> str:
-    key = re.sub(r"[^a-z0-9]+", "_", reason.lower()).strip("_")
+    key = _REASON_KEY_SEPARATOR_RE.sub("_", reason.lower()).strip("_")
     return key or "unknown"
@@ -137,6 +137,8 @@ def _candidate_commands(text: str) -> tuple[str, ...]:
 
 
 def _commands_from_code_fences(text: str) -> list[str]:
+    if "```" not in text:
+        return []
     commands: list[str] = []
     for match in _CODE_FENCE_RE.finditer(text):
         language = _fence_language(match.group("lang"))
@@ -153,10 +155,14 @@ def _fence_language(language: str) -> str:
 
 
 def _without_code_fences(text: str) -> str:
+    if "```" not in text:
+        return text
     return _CODE_FENCE_RE.sub("", text)
 
 
 def _commands_from_inline_code(text: str) -> list[str]:
+    if "`" not in text:
+        return []
     return [
         command
         for match in _INLINE_CODE_RE.finditer(text)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
 import json
 import os
 import shlex
@@ -14,20 +15,23 @@ from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 from inspect import isawaitable
 from pathlib import Path
-from typing import Any, Protocol, TypeAlias
+from typing import Any, Protocol
 from uuid import uuid4
 
 from ..interfaces import ExecutionResult, StreamingCommandRunner
 
-StringParts: TypeAlias = list[str]
-
 JOB_OUTPUT_LIMIT = 16_000
+_TRUNCATED_OUTPUT_MARKER = "[truncated: kept latest job output]\n"
+_ARTIFACT_SUFFIXES = frozenset(
+    {".png", ".jpg", ".jpeg", ".svg", ".pdf", ".csv", ".json", ".log", ".txt"}
+)
 DEFAULT_JOB_TIMEOUT_SECONDS = 900.0
 DEFAULT_JOB_MAX_HISTORY = 200
 DEFAULT_JOB_RETENTION_DAYS = 30
 # Bound each watcher queue so a slow or disconnected consumer cannot grow it
 # without limit; on overflow the stale snapshot is dropped (latest-wins).
 _WATCH_QUEUE_MAXSIZE = 256
+_OUTPUT_PERSIST_INTERVAL_SECONDS = 0.5
 
 
 def _offer_snapshot(
@@ -71,8 +75,7 @@ class BackgroundJobSnapshot:
 
     @property
     def duration_seconds(self) -> float:
-        end = self.finished_at or datetime.now(UTC)
-        return max(0.0, (end - self.started_at).total_seconds())
+        return _duration_seconds(self.started_at, self.finished_at)
 
 
 @dataclass(frozen=True)
@@ -116,6 +119,30 @@ class BackgroundJobController(Protocol):
         """Stop process-owned running jobs during shutdown."""
 
 
+@dataclass
+class _OutputBuffer:
+    """Job output kept as chunks with a running length, capped at the limit."""
+
+    parts: list[str] = field(default_factory=list)
+    chars: int = 0
+
+    @classmethod
+    def of(cls, text: str) -> _OutputBuffer:
+        return cls([text], len(text))
+
+    def append(self, text: str) -> None:
+        self.parts.append(text)
+        self.chars += len(text)
+        if self.chars <= JOB_OUTPUT_LIMIT:
+            return
+        kept = "".join(self.parts)[-JOB_OUTPUT_LIMIT:]
+        self.parts[:] = [_TRUNCATED_OUTPUT_MARKER, kept]
+        self.chars = len(_TRUNCATED_OUTPUT_MARKER) + len(kept)
+
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
 @dataclass
 class _BackgroundJob:
     job_id: str
@@ -128,8 +155,8 @@ class _BackgroundJob:
     task: asyncio.Task[None] | None = None
     status: JobStatus = JobStatus.RUNNING
     finished_at: datetime | None = None
-    stdout_parts: StringParts = field(default_factory=list)
-    stderr_parts: StringParts = field(default_factory=list)
+    stdout: _OutputBuffer = field(default_factory=_OutputBuffer)
+    stderr: _OutputBuffer = field(default_factory=_OutputBuffer)
     exit_code: int | None = None
 
 
@@ -152,6 +179,7 @@ class BackgroundJobService:
         self._event_observer = event_observer
         self._jobs, migrated = _load_jobs(path)
         self._watchers: dict[str, set[asyncio.Queue[BackgroundJobSnapshot]]] = {}
+        self._persisted_at = 0.0
         if migrated:
             self._persist()
 
@@ -242,22 +270,27 @@ class BackgroundJobService:
         try:
             result = await self._command_service.run_streaming(
                 command,
-                on_stdout=lambda text: self._append_job_output(job, job.stdout_parts, text),
-                on_stderr=lambda text: self._append_job_output(job, job.stderr_parts, text),
+                on_stdout=lambda text: self._append_job_output(job, job.stdout, text),
+                on_stderr=lambda text: self._append_job_output(job, job.stderr, text),
                 timeout_seconds=timeout_seconds,
             )
         except asyncio.CancelledError:
             await self._finish_job(job, JobStatus.STOPPED, exit_code=None)
             raise
         except Exception as exc:  # noqa: BLE001 - background jobs preserve failure state
-            await self._append_job_output(job, job.stderr_parts, str(exc))
+            await self._append_job_output(job, job.stderr, str(exc))
             await self._finish_job(job, JobStatus.FAILED, exit_code=1)
             return
         await self._finish_job(job, _status_for_result(result), exit_code=result.exit_code)
 
-    async def _append_job_output(self, job: _BackgroundJob, parts: StringParts, text: str) -> None:
-        await _append_output(parts, text)
-        self._persist()
+    async def _append_job_output(
+        self, job: _BackgroundJob, output: _OutputBuffer, text: str
+    ) -> None:
+        output.append(text)
+        # Chatty jobs would otherwise rewrite the whole store per chunk; status
+        # changes still persist immediately and carry the complete output.
+        if time.monotonic() - self._persisted_at >= _OUTPUT_PERSIST_INTERVAL_SECONDS:
+            self._persist()
         self._notify_watchers(job)
 
     async def _finish_job(
@@ -276,8 +309,11 @@ class BackgroundJobService:
             await result
 
     def _notify_watchers(self, job: _BackgroundJob) -> None:
+        queues = self._watchers.get(job.job_id)
+        if not queues:
+            return
         snapshot = _snapshot(job)
-        for queue in self._watchers.get(job.job_id, set()):
+        for queue in queues:
             _offer_snapshot(queue, snapshot)
 
     def _persist(self) -> None:
@@ -285,6 +321,7 @@ class BackgroundJobService:
             return
         snapshots = self._pruned_snapshots()
         _persist_jobs(self._path, snapshots)
+        self._persisted_at = time.monotonic()
 
     def _pruned_snapshots(self) -> tuple[BackgroundJobSnapshot, ...]:
         snapshots = pruned_job_snapshots(
@@ -299,15 +336,6 @@ class BackgroundJobService:
         return snapshots
 
 
-async def _append_output(parts: StringParts, text: str) -> None:
-    parts.append(text)
-    total = sum(len(part) for part in parts)
-    if total <= JOB_OUTPUT_LIMIT:
-        return
-    joined = "".join(parts)[-JOB_OUTPUT_LIMIT:]
-    parts[:] = ["[truncated: kept latest job output]\n", joined]
-
-
 def _finish_job(job: _BackgroundJob, status: JobStatus, *, exit_code: int | None) -> None:
     job.status = status
     job.exit_code = exit_code
@@ -328,8 +356,8 @@ def _snapshot(job: _BackgroundJob) -> BackgroundJobSnapshot:
         started_at=job.started_at,
         finished_at=job.finished_at,
         timeout_seconds=job.timeout_seconds,
-        stdout="".join(job.stdout_parts),
-        stderr="".join(job.stderr_parts),
+        stdout=job.stdout.text(),
+        stderr=job.stderr.text(),
         exit_code=job.exit_code,
         artifact_paths=job.artifact_paths,
     )
@@ -352,13 +380,14 @@ def pruned_job_snapshots(
 ) -> tuple[BackgroundJobSnapshot, ...]:
     reference = now or datetime.now(UTC)
     cutoff = reference - timedelta(days=retention_days)
-    running = tuple(item for item in snapshots if item.status is JobStatus.RUNNING)
-    finished = tuple(
-        item
-        for item in snapshots
-        if item.status is not JobStatus.RUNNING and _finished_at_or_started_at(item) >= cutoff
-    )
-    kept_finished = tuple(sorted(finished, key=_snapshot_sort_key)[:max_history])
+    running: list[BackgroundJobSnapshot] = []
+    finished: list[BackgroundJobSnapshot] = []
+    for item in snapshots:
+        if item.status is JobStatus.RUNNING:
+            running.append(item)
+        elif _finished_at_or_started_at(item) >= cutoff:
+            finished.append(item)
+    kept_finished = heapq.nsmallest(max_history, finished, key=_snapshot_sort_key)
     return tuple(sorted((*running, *kept_finished), key=_snapshot_sort_key))
 
 
@@ -384,9 +413,8 @@ def _command_tokens(command: str) -> list[str]:
 
 
 def _looks_like_artifact(token: str) -> bool:
-    suffixes = (".png", ".jpg", ".jpeg", ".svg", ".pdf", ".csv", ".json", ".log", ".txt")
     cleaned = token.strip("'\"")
-    return cleaned.startswith("/") and Path(cleaned).suffix.casefold() in suffixes
+    return cleaned.startswith("/") and Path(cleaned).suffix.casefold() in _ARTIFACT_SUFFIXES
 
 
 def _event_payload(phase: str, job: _BackgroundJob) -> dict[str, Any]:
@@ -398,10 +426,15 @@ def _event_payload(phase: str, job: _BackgroundJob) -> dict[str, Any]:
         "command": job.command,
         "goal": job.goal,
         "exit_code": job.exit_code,
-        "duration": _snapshot(job).duration_seconds,
+        "duration": _duration_seconds(job.started_at, job.finished_at),
     }
 
 
+def _duration_seconds(started_at: datetime, finished_at: datetime | None) -> float:
+    end = finished_at or datetime.now(UTC)
+    return max(0.0, (end - started_at).total_seconds())
+
+
 def _persist_jobs(path: Path, snapshots: tuple[BackgroundJobSnapshot, ...]) -> None:
     payload = {
         "version": JOBS_STORE_VERSION,
@@ -475,8 +508,8 @@ def _job_from_record(record: dict[str, Any]) -> tuple[_BackgroundJob | None, boo
             artifact_paths=tuple(str(item) for item in record.get("artifact_paths") or ()),
             status=status,
             finished_at=_parse_optional_datetime(record.get("finished_at")),
-            stdout_parts=[str(record.get("stdout") or "")],
-            stderr_parts=[str(record.get("stderr") or "")],
+            stdout=_OutputBuffer.of(str(record.get("stdout") or "")),
+            stderr=_OutputBuffer.of(str(record.get("stderr") or "")),
             exit_code=_optional_int(record.get("exit_code")),
         )
     except (KeyError, TypeError, ValueError):
@@ -489,7 +522,7 @@ def _mark_loaded_running_job(job: _BackgroundJob) -> tuple[_BackgroundJob, bool]
         return job, False
     job.status = JobStatus.STOPPED
     job.finished_at = datetime.now(UTC)
-    job.stderr_parts.append(RESTARTED_JOB_MESSAGE)
+    job.stderr.append(RESTARTED_JOB_MESSAGE)
     return job, True
 
 
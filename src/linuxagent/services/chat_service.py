@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import os
 from dataclasses import dataclass, field
@@ -12,9 +13,10 @@ from typing import Any
 from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
 
 DEFAULT_SESSION_ID = "default"
+_JOURNAL_COMPACT_ENTRIES = 32
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatSession:
     thread_id: str
     title: str
@@ -29,6 +31,11 @@ class ChatService:
     max_messages: int
     _messages: list[BaseMessage] = field(default_factory=list)
     _sessions: dict[str, ChatSession] = field(default_factory=dict)
+    _journal_entries: int = 0
+
+    @property
+    def journal_path(self) -> Path:
+        return self.history_path.with_name(f"{self.history_path.name}.journal")
 
     def add(self, messages: list[BaseMessage]) -> None:
         self.replace_session(DEFAULT_SESSION_ID, [*self._messages, *messages])
@@ -62,46 +69,63 @@ class ChatService:
         self._messages = trimmed
 
     def list_sessions(self, *, limit: int | None = 10) -> list[ChatSession]:
-        sessions = sorted(self._sessions.values(), key=lambda session: session.updated_at)
-        latest_first = list(reversed(sessions))
-        return latest_first if limit is None else latest_first[:limit]
+        # Iterate newest-inserted first so ties keep the previous latest-first order.
+        sessions = reversed(self._sessions.values())
+        if limit is None:
+            return sorted(sessions, key=_session_updated_at, reverse=True)
+        return heapq.nlargest(limit, sessions, key=_session_updated_at)
 
     def get_session(self, thread_id: str) -> ChatSession | None:
         return self._sessions.get(thread_id)
 
     def save(self) -> None:
         self.history_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.history_path.exists():
-            fd = os.open(self.history_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
-            os.close(fd)
-        os.chmod(self.history_path, 0o600)
-        data = {
-            "version": 2,
-            "sessions": [
-                {
-                    "thread_id": session.thread_id,
-                    "title": session.title,
-                    "created_at": session.created_at.isoformat(),
-                    "updated_at": session.updated_at.isoformat(),
-                    "messages": messages_to_dict(list(session.messages)),
-                }
-                for session in self._sessions.values()
-            ],
-        }
-        self.history_path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
-        os.chmod(self.history_path, 0o600)
-
-    def load(self) -> None:
-        if not self.history_path.is_file():
+        # Write beside the target and swap it in, so a crash mid-save leaves the
+        # previous history intact instead of a truncated file.
+        tmp_path = self.history_path.with_name(f"{self.history_path.name}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            os.fchmod(handle.fileno(), 0o600)
+            # Encode one session at a time so peak memory tracks the largest
+            # session rather than the whole history.
+            handle.write(b'{"version":2,"sessions":[')
+            for index, session in enumerate(self._sessions.values()):
+                if index:
+                    handle.write(b",")
+                handle.write(_session_json(session).encode("utf-8"))
+            handle.write(b"]}")
+        os.replace(tmp_path, self.history_path)
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_entries = 0
+
+    def save_session(self, thread_id: str) -> None:
+        """Persist one session by appending it to the history journal.
+
+        The full history file is rewritten only when it does not exist yet or
+        the journal has grown long; :meth:`save` always compacts.
+        """
+        session = self._sessions.get(thread_id)
+        if session is None:
             return
-        raw = json.loads(self.history_path.read_text(encoding="utf-8"))
-        if isinstance(raw, list):
-            self.replace(messages_from_dict(raw))
+        if not self.history_path.is_file() or self._journal_entries >= _JOURNAL_COMPACT_ENTRIES:
+            self.save()
             return
-        if isinstance(raw, dict):
-            self._load_sessions(raw.get("sessions"))
+        line = _session_json(session)
+        fd = os.open(self.journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        with os.fdopen(fd, "ab") as handle:
+            os.fchmod(handle.fileno(), 0o600)
+            handle.write(f"{line}\n".encode())
+        self._journal_entries += 1
+
+    def load(self) -> None:
+        if self.history_path.is_file():
+            raw = json.loads(self.history_path.read_bytes())
+            if isinstance(raw, list):
+                self.replace(messages_from_dict(raw))
+            elif isinstance(raw, dict):
+                self._load_sessions(raw.get("sessions"))
+        if self.journal_path.is_file():
+            self._replay_journal()
 
     def export_markdown(self) -> str:
         lines: list[str] = []
@@ -120,6 +144,16 @@ class ChatService:
             if isinstance(raw_session, dict):
                 self._load_session(raw_session, fallback_time + timedelta(microseconds=index))
 
+    def _replay_journal(self) -> None:
+        for line in self.journal_path.read_bytes().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict):
+                self._load_session(entry, _now())
+                self._journal_entries += 1
+
     def _load_session(self, raw_session: dict[str, Any], fallback_time: datetime) -> None:
         raw_thread_id = raw_session.get("thread_id")
         raw_messages = raw_session.get("messages")
@@ -140,6 +174,24 @@ class ChatService:
         self._messages = trimmed
 
 
+def _session_payload(session: ChatSession) -> dict[str, Any]:
+    return {
+        "thread_id": session.thread_id,
+        "title": session.title,
+        "created_at": session.created_at.isoformat(),
+        "updated_at": session.updated_at.isoformat(),
+        "messages": messages_to_dict(list(session.messages)),
+    }
+
+
+def _session_json(session: ChatSession) -> str:
+    return json.dumps(_session_payload(session), ensure_ascii=False, separators=(",", ":"))
+
+
+def _session_updated_at(session: ChatSession) -> datetime:
+    return session.updated_at
+
+
 def _now() -> datetime:
     return datetime.now(UTC)
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..cluster import SSHError
 from ..cluster.remote_profile import preflight_commands
@@ -14,6 +14,14 @@ from ..interfaces import ExecutionResult, RemoteCommandExecutor
 class ClusterService:
     config: ClusterConfig
     ssh: RemoteCommandExecutor
+    _host_aliases: tuple[tuple[ClusterHost, frozenset[str]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Config is frozen, so fold each host's names once instead of per lookup.
+        aliases = tuple((host, _aliases(host)) for host in self.config.hosts)
+        object.__setattr__(self, "_host_aliases", aliases)
 
     @property
     def hosts(self) -> tuple[ClusterHost, ...]:
@@ -39,7 +47,7 @@ class ClusterService:
         if not names:
             return ()
         wanted = {name.casefold() for name in names}
-        return tuple(host for host in self.hosts if wanted.intersection(_aliases(host)))
+        return tuple(host for host, aliases in self._host_aliases if not wanted.isdisjoint(aliases))
 
     def remote_profiles(self, hosts: tuple[ClusterHost, ...]) -> tuple[dict[str, object], ...]:
         return tuple(host.remote_profile_record() for host in hosts)
@@ -55,5 +63,5 @@ class ClusterService:
         await self.ssh.close()
 
 
-def _aliases(host: ClusterHost) -> tuple[str, ...]:
-    return (host.name.casefold(), host.hostname.casefold())
+def _aliases(host: ClusterHost) -> frozenset[str]:
+    return frozenset((host.name.casefold(), host.hostname.casefold()))
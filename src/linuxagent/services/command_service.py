@@ -113,6 +113,6 @@ class CommandService:
             return
         self._learner.record(command, result)
         try:
-            self._learner.save()
+            self._learner.save_if_due()
         except ValueError:
             return
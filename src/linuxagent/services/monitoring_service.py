@@ -6,6 +6,7 @@ import asyncio
 import platform
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Literal
 
 import psutil
@@ -71,15 +72,23 @@ def collect_system_snapshot() -> dict[str, Any]:
     vm = psutil.virtual_memory()
     disk = psutil.disk_usage("/")
     return {
-        "platform": platform.system(),
-        "release": platform.release(),
-        "python_version": sys.version.split()[0],
+        **_static_host_facts(),
         "cpu_percent": psutil.cpu_percent(interval=None),
         "cpu_count": psutil.cpu_count(logical=True),
         "memory_total": vm.total,
         "memory_percent": vm.percent,
         "disk_total": disk.total,
         "disk_percent": disk.percent,
+    }
+
+
+@lru_cache(maxsize=1)
+def _static_host_facts() -> dict[str, Any]:
+    """Host facts that cannot change while the process runs."""
+    return {
+        "platform": platform.system(),
+        "release": platform.release(),
+        "python_version": sys.version.split()[0],
         "boot_time": int(psutil.boot_time()),
     }
 
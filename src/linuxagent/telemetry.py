@@ -138,10 +138,10 @@ class TelemetryRecorder:
         try:
             yield
         except BaseException as exc:
-            self._append_span(name, trace_id, start, "error", attributes, str(exc))
+            self._append_span(name, trace_id, _elapsed_ms(start), "error", attributes, str(exc))
             raise
         else:
-            self._append_span(name, trace_id, start, "ok", attributes, None)
+            self._append_span(name, trace_id, _elapsed_ms(start), "ok", attributes, None)
 
     def event(
         self,
@@ -154,7 +154,7 @@ class TelemetryRecorder:
     ) -> None:
         self._record_usage_event(name, attributes or {})
         if self.enabled:
-            self._append_span(name, trace_id, time.monotonic(), status, attributes, error)
+            self._append_span(name, trace_id, 0, status, attributes, error)
 
     def llm_usage_summary(self) -> LLMUsageSummary:
         with self._usage_lock:
@@ -185,7 +185,7 @@ class TelemetryRecorder:
         self,
         name: str,
         trace_id: str,
-        start: float,
+        duration_ms: int,
         status: str,
         attributes: dict[str, Any] | None,
         error: str | None,
@@ -196,7 +196,7 @@ class TelemetryRecorder:
             "span_id": uuid.uuid4().hex,
             "name": name,
             "status": status,
-            "duration_ms": int((time.monotonic() - start) * 1000),
+            "duration_ms": duration_ms,
             "attributes": attributes or {},
         }
         if error is not None:
@@ -273,6 +273,10 @@ def _validate_http_url(url: str) -> None:
         raise TelemetryExportError("telemetry OTLP endpoint must be http:// or https://")
 
 
+def _elapsed_ms(start: float) -> int:
+    return int((time.monotonic() - start) * 1000)
+
+
 def _int_attribute(attributes: dict[str, Any], key: str) -> int:
     value = attributes.get(key)
     if isinstance(value, bool):
@@ -206,7 +206,7 @@ def _resource_keys(item: ToolCatalogItem) -> str:
     keys = item.sandbox.get("resource_keys")
     if not isinstance(keys, list):
         return "[]"
-    return "[" + ",".join(str(key) for key in keys if str(key)) + "]"
+    return "[" + ",".join(text for key in keys if (text := str(key))) + "]"
 
 
 def _parallel_safe(item: ToolCatalogItem) -> str:
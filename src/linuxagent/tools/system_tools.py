@@ -8,18 +8,15 @@ state) and avoids the common trap of module-global dependencies.
 
 from __future__ import annotations
 
-import platform
-import sys
 from pathlib import Path
 
-import psutil
 from langchain_core.tools import BaseTool, tool
 
 from ..config.models import MonitoringConfig, SandboxToolConfig
 from ..interfaces import CommandExecutor, CommandSource
 from ..sandbox import SandboxProfile
 from ..security import guard_execution_result, redact_text
-from ..services import evaluate_alerts
+from ..services import collect_system_snapshot, evaluate_alerts
 from .sandbox import (
     ToolHITLMode,
     ToolSandboxSpec,
@@ -95,7 +92,7 @@ def make_get_system_info_tool(
         Includes kernel, python version, CPU usage, memory, root-fs usage,
         and uptime. No arguments.
         """
-        snapshot = _system_snapshot()
+        snapshot = collect_system_snapshot()
         config = monitoring_config or MonitoringConfig()
         snapshot["alerts"] = [
             {
@@ -122,23 +119,6 @@ def make_get_system_info_tool(
     )
 
 
-def _system_snapshot() -> dict[str, object]:
-    vm = psutil.virtual_memory()
-    disk = psutil.disk_usage("/")
-    return {
-        "platform": platform.system(),
-        "release": platform.release(),
-        "python_version": sys.version.split()[0],
-        "cpu_percent": psutil.cpu_percent(interval=None),
-        "cpu_count": psutil.cpu_count(logical=True),
-        "memory_total": vm.total,
-        "memory_percent": vm.percent,
-        "disk_total": disk.total,
-        "disk_percent": disk.percent,
-        "boot_time": int(psutil.boot_time()),
-    }
-
-
 class LogFileAccessError(ValueError):
     """Raised when log search attempts to read outside configured roots."""
 
@@ -215,17 +195,20 @@ def _search_log_matches(
         raise LogFileAccessError(f"log file exceeds max size ({max_file_bytes} bytes): {path}")
     matches: list[str] = []
     deadline = current_tool_deadline()
-    with path.open("r", encoding="utf-8", errors="replace") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            # Observe the per-tool deadline so a long scan does not run on in an
-            # orphaned worker thread after the call has timed out or been cancelled.
-            raise_if_tool_runtime_cancelled(deadline=deadline)
-            text = line.rstrip("\n")
-            if query in text.casefold():
-                redacted = redact_text(text)
-                matches.append(f"{line_number}:{redacted.text}")
-                if len(matches) >= min(max_matches, limits.max_matches):
-                    break
+    content = path.read_text(encoding="utf-8", errors="replace")
+    # One casefolded pass over the size-capped file rules out logs without a hit
+    # before any per-line work.
+    if query not in content.casefold():
+        return matches
+    for line_number, text in enumerate(content.split("\n"), start=1):
+        # Observe the per-tool deadline so a long scan does not run on in an
+        # orphaned worker thread after the call has timed out or been cancelled.
+        raise_if_tool_runtime_cancelled(deadline=deadline)
+        if query in text.casefold():
+            redacted = redact_text(text)
+            matches.append(f"{line_number}:{redacted.text}")
+            if len(matches) >= min(max_matches, limits.max_matches):
+                break
     return matches
 
 
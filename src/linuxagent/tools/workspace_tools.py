@@ -253,15 +253,19 @@ def _search_file(
     deadline: float | None,
 ) -> list[str]:
     matches: list[str] = []
-    with path.open("r", encoding="utf-8", errors="replace") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            raise_if_tool_runtime_cancelled(deadline=deadline)
-            if query in line.casefold():
-                relpath = path.relative_to(root)
-                redacted = redact_text(line.rstrip())
-                matches.append(f"{relpath}:{line_number}:{redacted.text}")
-                if len(matches) >= remaining:
-                    break
+    content = path.read_text(encoding="utf-8", errors="replace")
+    # Most files in a tree do not match; a single casefolded scan skips them
+    # without splitting and folding every line.
+    if query not in content.casefold():
+        return matches
+    for line_number, line in enumerate(content.split("\n"), start=1):
+        raise_if_tool_runtime_cancelled(deadline=deadline)
+        if query in line.casefold():
+            relpath = path.relative_to(root)
+            redacted = redact_text(line.rstrip())
+            matches.append(f"{relpath}:{line_number}:{redacted.text}")
+            if len(matches) >= remaining:
+                break
     return matches
 
 
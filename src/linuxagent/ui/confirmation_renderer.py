@@ -381,7 +381,7 @@ def _high_review_required(payload: dict[str, Any]) -> bool:
 def _string_list(value: Any) -> list[str]:
     if not isinstance(value, list | tuple):
         return []
-    return [str(item) for item in value if str(item)]
+    return [text for item in value if (text := str(item))]
 
 
 def _sandbox_summary(sandbox: dict[str, Any], translator: Translator) -> str:
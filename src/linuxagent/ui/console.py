@@ -60,6 +60,7 @@ class ConsoleUI(UserInterface):
         self._prompt_symbol = prompt_symbol
         self._history_path = history_path or (Path.home() / ".linuxagent" / "prompt_history")
         self._translator = translator or default_translator()
+        self._transient_activity_prefixes = _transient_activity_prefixes(self._translator)
         self._provider = provider
         self._model = model
         self._activity_visible = True
@@ -281,20 +282,7 @@ class ConsoleUI(UserInterface):
         return _working_label(text, self._translator) == self._translator.t("ui.working.title")
 
     def _is_transient_activity(self, text: str) -> bool:
-        if text.startswith(self._translator.t("ui.working.activity_prefix")):
-            return True
-        return any(text.startswith(prefix) for prefix in self._tool_failure_activity_prefixes())
-
-    def _tool_failure_activity_prefixes(self) -> tuple[str, ...]:
-        specs: tuple[tuple[str, dict[str, str]], ...] = (
-            ("runtime.tool.activity_guidance_failed", {"path": ""}),
-            ("runtime.tool.activity_read_failed", {"path": ""}),
-            ("runtime.tool.activity_list_failed", {"path": ""}),
-            ("runtime.tool.activity_search_failed", {"target": ""}),
-        )
-        return tuple(
-            prefix for key, params in specs if (prefix := self._translator.t(key, **params).strip())
-        )
+        return text.startswith(self._transient_activity_prefixes)
 
     def _ensure_working_refresh_task(self) -> None:
         if self._working_refresh_task is not None and not self._working_refresh_task.done():
@@ -515,7 +503,7 @@ class ConsoleUI(UserInterface):
         return "bright_black"
 
     def _approval_response(self, payload: dict[str, Any]) -> dict[str, Any]:
-        files = tuple(str(item) for item in payload.get("files_changed", ()) if str(item))
+        files = tuple(text for item in payload.get("files_changed", ()) if (text := str(item)))
         if payload.get("type") == "confirm_file_patch":
             _review_file_patch_diff(payload, self._console, self._translator)
         if payload.get("type") == "confirm_file_patch" and len(files) > 1:
@@ -546,6 +534,12 @@ HERO_WORD = (
 )
 _HERO_GRADIENT_START = (0, 212, 255)
 _HERO_GRADIENT_END = (255, 102, 217)
+_TOOL_FAILURE_ACTIVITY_SPECS: tuple[tuple[str, dict[str, str]], ...] = (
+    ("runtime.tool.activity_guidance_failed", {"path": ""}),
+    ("runtime.tool.activity_read_failed", {"path": ""}),
+    ("runtime.tool.activity_list_failed", {"path": ""}),
+    ("runtime.tool.activity_search_failed", {"target": ""}),
+)
 
 
 def _hero_gradient_color(col: int, width: int) -> str:
@@ -680,6 +674,15 @@ def _consume_async_task_result(task: asyncio.Task[None]) -> None:
         return
 
 
+def _transient_activity_prefixes(translator: Translator) -> tuple[str, ...]:
+    failure_prefixes = (
+        prefix
+        for key, params in _TOOL_FAILURE_ACTIVITY_SPECS
+        if (prefix := translator.t(key, **params).strip())
+    )
+    return (translator.t("ui.working.activity_prefix"), *failure_prefixes)
+
+
 def _terminal_active_view(view: ActiveTurnView) -> bool:
     return view.status in {"completed", "failed", "cancelled"}
 
@@ -707,7 +710,7 @@ def _approval_summary_key(decision: str) -> str:
 
 def _approval_subject(payload: dict[str, Any], translator: Translator) -> str:
     if payload.get("type") == "confirm_file_patch":
-        files = [str(item) for item in payload.get("files_changed", ()) if str(item)]
+        files = [text for item in payload.get("files_changed", ()) if (text := str(item))]
         return translator.t("ui.approval.summary.file_patch", count=len(files))
     command = str(payload.get("command") or payload.get("type") or "")
     return _compact_subject(command)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import cached_property
 
 from rich.console import Group, RenderableType
 from rich.panel import Panel
@@ -44,7 +45,7 @@ class DiffFile:
             return self.new_path
         return f"{self.old_path} -> {self.new_path}"
 
-    @property
+    @cached_property
     def stats(self) -> DiffStats:
         return DiffStats.from_lines(self.lines)
 
@@ -57,8 +58,13 @@ class DiffStats:
 
     @classmethod
     def from_lines(cls, lines: tuple[str, ...]) -> DiffStats:
-        additions = sum(1 for line in lines if _is_addition(line))
-        deletions = sum(1 for line in lines if _is_deletion(line))
+        additions = 0
+        deletions = 0
+        for line in lines:
+            if _is_addition(line):
+                additions += 1
+            elif _is_deletion(line):
+                deletions += 1
         return cls(additions=additions, deletions=deletions, files=1)
 
     @classmethod
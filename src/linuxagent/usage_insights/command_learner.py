@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import logging
 import os
 import shlex
-from dataclasses import asdict, dataclass
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 from ..interfaces import ExecutionResult
 from ..security import redact_text
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_FLUSH_EVERY_RECORDS = 32
+_FLUSH_INTERVAL_SECONDS = 10.0
+
+
+@dataclass(slots=True)
 class CommandStats:
     count: int = 0
     success_count: int = 0
@@ -31,43 +40,110 @@ class CommandLearner:
     def __init__(self, path: Path | None = None) -> None:
         self._path = path
         self._stats: dict[str, CommandStats] = {}
+        self._dirty = 0
+        self._last_flush: float | None = None
+        self._deferred_load: Path | None = None
+        self._load_lock = threading.Lock()
+        self._unreadable_path: Path | None = None
 
     def record(self, command: str, result: ExecutionResult) -> None:
+        self._load_deferred()
         key = self.normalize(command)
-        stats = self._stats.setdefault(key, CommandStats())
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = CommandStats()
         stats.count += 1
         if result.exit_code == 0:
             stats.success_count += 1
         stats.total_duration += result.duration
+        self._dirty += 1
 
     def stats_for(self, command: str) -> CommandStats | None:
+        self._load_deferred()
         return self._stats.get(self.normalize(command))
 
     def top_commands(self, limit: int = 5) -> list[tuple[str, CommandStats]]:
-        ranked = sorted(
+        self._load_deferred()
+        return heapq.nlargest(
+            limit,
             self._stats.items(),
             key=lambda item: (item[1].count, item[1].success_rate),
-            reverse=True,
         )
-        return ranked[:limit]
 
     def save(self, path: Path | None = None) -> None:
         target = path or self._path
         if target is None:
             raise ValueError("path is required to save learner state")
+        self._load_deferred()
+        if target == self._unreadable_path:
+            # Never replace a state file we could not parse with partial stats.
+            self._dirty = 0
+            self._last_flush = time.monotonic()
+            return
         target.parent.mkdir(parents=True, exist_ok=True)
-        if not target.exists():
-            fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
-            os.close(fd)
-        payload = {key: asdict(stats) for key, stats in self._stats.items()}
-        target.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        os.chmod(target, 0o600)
+        data = {
+            key: {
+                "count": stats.count,
+                "success_count": stats.success_count,
+                "total_duration": stats.total_duration,
+            }
+            for key, stats in self._stats.items()
+        }
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            os.fchmod(handle.fileno(), 0o600)
+            handle.write(payload)
+        self._dirty = 0
+        self._last_flush = time.monotonic()
+
+    def save_if_due(self) -> bool:
+        """Persist pending records once enough have accumulated or time has passed."""
+        if not self._dirty:
+            return False
+        if (
+            self._last_flush is not None
+            and self._dirty < _FLUSH_EVERY_RECORDS
+            and time.monotonic() - self._last_flush < _FLUSH_INTERVAL_SECONDS
+        ):
+            return False
+        self.save()
+        return True
+
+    def flush(self) -> None:
+        """Persist any records not yet written by :meth:`save_if_due`."""
+        if self._dirty and self._path is not None:
+            self.save()
 
     def load(self, path: Path | None = None) -> None:
-        target = path or self._path
+        self._deferred_load = None
+        self._read_stats(path or self._path)
+
+    def defer_load(self, path: Path | None = None) -> None:
+        """Read saved stats on first use instead of now, keeping startup off disk."""
+        self._deferred_load = path or self._path
+
+    def _load_deferred(self) -> None:
+        if self._deferred_load is None:
+            return
+        with self._load_lock:
+            path = self._deferred_load
+            if path is None:
+                return
+            try:
+                self._read_stats(path)
+            except (AttributeError, OSError, TypeError, ValueError) as exc:
+                logger.warning("ignoring unreadable learner state %s: %s", path, exc)
+                self._unreadable_path = path
+            finally:
+                # Cleared only once the stats are installed, so callers that
+                # skip the lock on the fast path never see the pre-load dict.
+                self._deferred_load = None
+
+    def _read_stats(self, target: Path | None) -> None:
         if target is None or not target.is_file():
             return
-        raw = json.loads(target.read_text(encoding="utf-8"))
+        raw = json.loads(target.read_bytes())
         self._stats = {key: CommandStats(**value) for key, value in raw.items()}
 
     @staticmethod
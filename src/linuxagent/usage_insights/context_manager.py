@@ -9,7 +9,7 @@ from langchain_core.messages import AIMessage, BaseMessage
 _SUMMARY_PREFIX = "[summary]"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextManager:
     max_items: int
     _items: list[BaseMessage] = field(default_factory=list)
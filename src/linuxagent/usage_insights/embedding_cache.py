@@ -7,26 +7,42 @@ import json
 import os
 from pathlib import Path
 
+# In-process front for the on-disk cache so repeated searches do not reread one
+# JSON file per knowledge document; oldest entries are evicted first.
+_MEMORY_ENTRIES = 1024
+
 
 class EmbeddingCache:
     def __init__(self, directory: Path) -> None:
         self._directory = directory
+        self._memory: dict[str, tuple[float, ...]] = {}
 
     def get(self, text: str) -> list[float] | None:
-        path = self._path(text)
-        if not path.is_file():
+        cached = self._memory.get(text)
+        if cached is not None:
+            return list(cached)
+        try:
+            raw = json.loads(self._path(text).read_bytes())
+        except FileNotFoundError:
             return None
-        raw = json.loads(path.read_text(encoding="utf-8"))
-        return [float(value) for value in raw]
+        embedding = tuple(float(value) for value in raw)
+        self._remember(text, embedding)
+        return list(embedding)
 
     def set(self, text: str, embedding: list[float]) -> None:
         self._directory.mkdir(parents=True, exist_ok=True)
-        path = self._path(text)
-        if not path.exists():
-            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
-            os.close(fd)
-        path.write_text(json.dumps(embedding), encoding="utf-8")
-        os.chmod(path, 0o600)
+        payload = json.dumps(embedding).encode("utf-8")
+        fd = os.open(self._path(text), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            os.fchmod(handle.fileno(), 0o600)
+            handle.write(payload)
+        self._remember(text, tuple(embedding))
+
+    def _remember(self, text: str, embedding: tuple[float, ...]) -> None:
+        self._memory.pop(text, None)
+        if len(self._memory) >= _MEMORY_ENTRIES:
+            del self._memory[next(iter(self._memory))]
+        self._memory[text] = embedding
 
     def _path(self, text: str) -> Path:
         digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
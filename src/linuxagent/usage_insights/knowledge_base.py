@@ -6,15 +6,19 @@ from dataclasses import dataclass
 
 from .nlp_enhancer import NLPEnhancer
 
+# Repeated queries between mutations rank identically, so recent results are
+# reused until the next add().
+_SEARCH_CACHE_ENTRIES = 256
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class KnowledgeDocument:
     id: str
     content: str
     metadata: dict[str, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KnowledgeHit:
     document: KnowledgeDocument
     score: float
@@ -24,20 +28,37 @@ class KnowledgeBase:
     def __init__(self, enhancer: NLPEnhancer) -> None:
         self._enhancer = enhancer
         self._documents: list[KnowledgeDocument] = []
+        self._by_content: dict[str, KnowledgeDocument] = {}
+        self._search_cache: dict[tuple[str, int], tuple[KnowledgeHit, ...]] = {}
+        self._generation = 0
 
     def add(self, document: KnowledgeDocument) -> None:
         self._documents.append(document)
+        self._by_content.setdefault(document.content, document)
+        self._generation += 1
+        self._search_cache.clear()
 
     async def search(self, query: str, k: int = 5) -> list[KnowledgeHit]:
         if not self._documents:
             return []
-        candidates = [document.content for document in self._documents]
-        scored = await self._enhancer.find_similar_commands(query, candidates, top_k=k)
-        hits: list[KnowledgeHit] = []
-        for content, score in scored:
-            document = next(doc for doc in self._documents if doc.content == content)
-            hits.append(KnowledgeHit(document=document, score=score))
+        key = (query, k)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        generation = self._generation
+        hits = await self._rank(query, k)
+        if generation == self._generation:
+            if len(self._search_cache) >= _SEARCH_CACHE_ENTRIES:
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[key] = tuple(hits)
         return hits
 
+    async def _rank(self, query: str, k: int) -> list[KnowledgeHit]:
+        by_content = self._by_content
+        scored = await self._enhancer.find_similar_commands(query, list(by_content), top_k=k)
+        return [
+            KnowledgeHit(document=by_content[content], score=score) for content, score in scored
+        ]
+
     def snapshot(self) -> list[KnowledgeDocument]:
         return list(self._documents)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 
 from langchain_core.embeddings import Embeddings
@@ -24,12 +25,11 @@ class NLPEnhancer:
             return []
         query_emb = await self._embed_query(query)
         cand_embs = [await self._embed_document(candidate) for candidate in candidates]
-        scored = [
+        scored = (
             (candidate, _cosine(query_emb, embedding))
             for candidate, embedding in zip(candidates, cand_embs, strict=True)
-        ]
-        scored.sort(key=lambda item: item[1], reverse=True)
-        return scored[:top_k]
+        )
+        return heapq.nlargest(top_k, scored, key=lambda item: item[1])
 
     async def _embed_query(self, text: str) -> list[float]:
         cached = self._cache.get(text) if self._cache is not None else None
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from ..executors import is_destructive, is_interactive
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternAnalysis:
     command: str
     executable: str
@@ -8,7 +8,7 @@ from .command_learner import CommandLearner
 from .nlp_enhancer import NLPEnhancer
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recommendation:
     command: str
     score: float
@@ -1091,6 +1091,25 @@ async def test_resume_switches_to_saved_session_context(tmp_path) -> None:
     assert "second answer" in rendered
 
 
+async def test_resume_selection_ignores_non_decimal_digits(tmp_path) -> None:
+    chat_service = ChatService(tmp_path / "history.json", max_messages=10)
+    chat_service.add([HumanMessage(content="first question"), AIMessage(content="first answer")])
+    graph = _FakeGraph([{"messages": [HumanMessage(content="\u00b2"), AIMessage(content="ok")]}])
+    agent = LinuxAgent(
+        graph_runtime=GraphRuntime(graph),  # type: ignore[arg-type]
+        ui=_FakeUI(inputs=["/resume", "\u00b2"]),
+        chat_service=chat_service,
+        command_service=_command_service(),
+        audit=AuditLog(tmp_path / "audit.log"),
+        context_manager=ContextManager(10),
+        monitoring_service=_FakeMonitoringService(),  # type: ignore[arg-type]
+    )
+
+    await agent.run(thread_id="cli")
+
+    assert graph.calls[0]["messages"][-1].content == "\u00b2"
+
+
 async def test_resume_uses_interactive_selector_when_available(tmp_path) -> None:
     history_path = tmp_path / "history.json"
     chat_service = ChatService(history_path, max_messages=10)
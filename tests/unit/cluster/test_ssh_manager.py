@@ -12,11 +12,14 @@ object rather than mocked out.
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from typing import Any
 
 import paramiko
 import pytest
 
+from linuxagent.cluster.remote_command import RemoteCommand, validate_remote_command
 from linuxagent.cluster.ssh_manager import (
     SSHAuthError,
     SSHCommandTimeoutError,
@@ -137,6 +140,36 @@ def test_auto_add_policy_never_used() -> None:
         assert not isinstance(client._policy, paramiko.AutoAddPolicy)
 
 
+def test_known_hosts_are_parsed_once_per_file_version(tmp_path: Path) -> None:
+    known_hosts = tmp_path / "known_hosts"
+    host_key = paramiko.RSAKey.generate(1024)
+    known_hosts.write_text(f"db.example {host_key.get_name()} {host_key.get_base64()}\n")
+    mgr = SSHManager(ClusterConfig(known_hosts_path=known_hosts))
+
+    first = mgr._build_client().get_host_keys()
+    second = mgr._build_client().get_host_keys()
+
+    assert first is second
+    assert first.lookup("db.example") is not None
+    stat = known_hosts.stat()
+    os.utime(known_hosts, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert mgr._build_client().get_host_keys() is not first
+
+
+
+def test_shared_known_hosts_refuse_mutation(tmp_path: Path) -> None:
+    known_hosts = tmp_path / "known_hosts"
+    host_key = paramiko.RSAKey.generate(1024)
+    known_hosts.write_text(f"db.example {host_key.get_name()} {host_key.get_base64()}\n")
+    mgr = SSHManager(ClusterConfig(known_hosts_path=known_hosts))
+    shared = mgr._build_client().get_host_keys()
+
+    with pytest.raises(TypeError, match="read-only"):
+        shared.add("web.example", host_key.get_name(), host_key)
+    with pytest.raises(TypeError, match="read-only"):
+        del shared["db.example"]
+    assert mgr._build_client().get_host_keys().lookup("web.example") is None
+
 # ---------------------------------------------------------------------------
 # Exception mapping
 # ---------------------------------------------------------------------------
@@ -165,7 +198,7 @@ def test_unknown_host_is_translated(monkeypatch: pytest.MonkeyPatch) -> None:
         paramiko.SSHException("Server 'nonexistent.invalid' not found in known_hosts"),
     )
     with pytest.raises(SSHUnknownHostError, match="unknown host"):
-        mgr._execute_sync(_host(), "uname -a")
+        mgr._execute_remote_sync(_host(), validate_remote_command("uname -a"))
 
 
 def test_bad_host_key_is_translated(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -185,28 +218,28 @@ def test_bad_host_key_is_translated(monkeypatch: pytest.MonkeyPatch) -> None:
     exc = paramiko.BadHostKeyException("host", _StubKey(), _StubKey())
     _install_client(monkeypatch, mgr, exc)
     with pytest.raises(SSHUnknownHostError, match="host key mismatch"):
-        mgr._execute_sync(_host(), "uname -a")
+        mgr._execute_remote_sync(_host(), validate_remote_command("uname -a"))
 
 
 def test_auth_failure_is_translated(monkeypatch: pytest.MonkeyPatch) -> None:
     mgr = SSHManager(ClusterConfig())
     _install_client(monkeypatch, mgr, paramiko.AuthenticationException("bad key"))
     with pytest.raises(SSHAuthError, match="authentication failed"):
-        mgr._execute_sync(_host(), "uname -a")
+        mgr._execute_remote_sync(_host(), validate_remote_command("uname -a"))
 
 
 def test_tcp_failure_is_translated(monkeypatch: pytest.MonkeyPatch) -> None:
     mgr = SSHManager(ClusterConfig())
     _install_client(monkeypatch, mgr, OSError("connection refused"))
     with pytest.raises(SSHConnectionError, match="failed to connect"):
-        mgr._execute_sync(_host(), "uname -a")
+        mgr._execute_remote_sync(_host(), validate_remote_command("uname -a"))
 
 
 def test_default_remote_profile_sends_raw_command(monkeypatch: pytest.MonkeyPatch) -> None:
     mgr = SSHManager(ClusterConfig())
     client = _install_recording_client(monkeypatch, mgr)
 
-    result = mgr._execute_sync(_host(), "echo 'hello world'")
+    result = mgr._execute_remote_sync(_host(), validate_remote_command("echo 'hello world'"))
 
     assert client.commands == ["echo 'hello world'"]
     assert result.command == "echo 'hello world'"
@@ -221,7 +254,7 @@ def test_default_remote_profile_quotes_shell_expansion_tokens(
     mgr = SSHManager(ClusterConfig())
     client = _install_recording_client(monkeypatch, mgr)
 
-    result = mgr._execute_sync(_host(), "cat ~/.ssh/id_rsa /tmp/*")
+    result = mgr._execute_remote_sync(_host(), validate_remote_command("cat ~/.ssh/id_rsa /tmp/*"))
 
     assert client.commands == ["cat '~/.ssh/id_rsa' '/tmp/*'"]
     assert result.remote is not None
@@ -241,7 +274,7 @@ def test_remote_profile_wraps_cwd_and_clean_environment(
         }
     )
 
-    result = mgr._execute_sync(host, "systemctl status nginx")
+    result = mgr._execute_remote_sync(host, validate_remote_command("systemctl status nginx"))
 
     assert client.commands == [
         "cd /srv/app && env -i "
@@ -264,7 +297,7 @@ def test_remote_profile_rejects_sudo_when_disabled(
     )
 
     with pytest.raises(SSHRemoteCommandError, match="sudo is not allowed"):
-        mgr._execute_sync(_host(), "sudo -n systemctl status nginx")
+        mgr._execute_remote_sync(_host(), validate_remote_command("sudo -n systemctl status nginx"))
 
 
 def test_remote_profile_allows_sudo_allowlisted_command(
@@ -280,7 +313,9 @@ def test_remote_profile_allows_sudo_allowlisted_command(
         }
     )
 
-    result = mgr._execute_sync(host, "sudo -n systemctl status nginx")
+    result = mgr._execute_remote_sync(
+        host, validate_remote_command("sudo -n systemctl status nginx")
+    )
 
     assert client.commands == ["sudo -n systemctl status nginx"]
     assert result.remote is not None
@@ -298,7 +333,7 @@ def test_remote_profile_rejects_sudo_outside_allowlist() -> None:
     )
 
     with pytest.raises(SSHRemoteCommandError, match="allowlist"):
-        mgr._execute_sync(host, "sudo -n reboot")
+        mgr._execute_remote_sync(host, validate_remote_command("sudo -n reboot"))
 
 
 class _BufferedChannel:
@@ -395,7 +430,7 @@ def test_remote_command_drains_stdout_and_stderr_before_exit_status(
     )
     monkeypatch.setattr(mgr, "_get_or_connect", lambda _host: _ChannelClient(channel))
 
-    result = mgr._execute_sync(_host(), "uptime")
+    result = mgr._execute_remote_sync(_host(), validate_remote_command("uptime"))
 
     assert result.exit_code == 7
     assert result.stdout == "line 1\nline 2\n"
@@ -413,7 +448,7 @@ def test_remote_command_timeout_closes_channel_and_discards_client(
     monkeypatch.setattr(mgr, "_get_or_connect", lambda _host: client)
 
     with pytest.raises(SSHCommandTimeoutError, match="timed out after"):
-        mgr._execute_sync(host, "tail -f /var/log/syslog")
+        mgr._execute_remote_sync(host, validate_remote_command("tail -f /var/log/syslog"))
 
     assert channel.closed is True
     assert client.closed is True
@@ -475,7 +510,7 @@ def test_dead_pool_entry_is_closed_before_reconnect(monkeypatch: pytest.MonkeyPa
     monkeypatch.setattr("linuxagent.cluster.ssh_manager._is_alive", lambda _client: False)
     _install_client(monkeypatch, mgr, OSError("network down"))
     with pytest.raises(SSHConnectionError):
-        mgr._execute_sync(_host(), "uname")
+        mgr._execute_remote_sync(_host(), validate_remote_command("uname"))
     assert closed["value"] is True
 
 
@@ -489,11 +524,13 @@ async def test_execute_many_isolates_per_host_failures(
 ) -> None:
     mgr = SSHManager(ClusterConfig())
 
-    async def _fail(host: ClusterHost, command: str, *, trace_id: str | None = None) -> None:
-        del command, trace_id
+    async def _fail(
+        host: ClusterHost, remote_command: RemoteCommand, *, trace_id: str | None = None
+    ) -> None:
+        del remote_command, trace_id
         raise SSHUnknownHostError(f"unknown host {host.hostname}")
 
-    monkeypatch.setattr(mgr, "execute", _fail)
+    monkeypatch.setattr(mgr, "_execute_validated", _fail)
     hosts = [
         ClusterHost(name="a", hostname="a.invalid", username="ops"),
         ClusterHost(name="b", hostname="b.invalid", username="ops"),
@@ -511,11 +548,13 @@ async def test_execute_many_rejects_remote_shell_syntax_before_connect(
 ) -> None:
     mgr = SSHManager(ClusterConfig())
 
-    def _should_not_connect(self: SSHManager, host: ClusterHost, command: str) -> None:
-        del self, host, command
+    def _should_not_connect(
+        self: SSHManager, host: ClusterHost, remote_command: RemoteCommand
+    ) -> None:
+        del self, host, remote_command
         raise AssertionError("unsafe remote command must not connect")
 
-    monkeypatch.setattr(SSHManager, "_execute_sync", _should_not_connect)
+    monkeypatch.setattr(SSHManager, "_execute_remote_sync", _should_not_connect)
     hosts = [
         ClusterHost(name="a", hostname="a.invalid", username="ops"),
         ClusterHost(name="b", hostname="b.invalid", username="ops"),
@@ -538,5 +577,94 @@ def test_failed_connect_does_not_poison_pool(monkeypatch: pytest.MonkeyPatch) ->
     mgr = SSHManager(ClusterConfig())
     _install_client(monkeypatch, mgr, OSError("network down"))
     with pytest.raises(SSHConnectionError):
-        mgr._execute_sync(_host(), "uname")
+        mgr._execute_remote_sync(_host(), validate_remote_command("uname"))
     assert mgr._pool == {}
+
+
+def test_connect_runs_outside_the_pool_lock(monkeypatch: pytest.MonkeyPatch) -> None:
+    mgr = SSHManager(ClusterConfig())
+    pool_lock_held: list[bool] = []
+
+    class _ProbeClient(paramiko.SSHClient):
+        def connect(self, *_args: Any, **_kwargs: Any) -> None:  # type: ignore[override]
+            pool_lock_held.append(mgr._lock.locked())
+
+    monkeypatch.setattr(mgr, "_build_client", _ProbeClient)
+    monkeypatch.setattr("linuxagent.cluster.ssh_manager._is_alive", lambda _client: True)
+
+    first = mgr._get_or_connect(_host())
+    second = mgr._get_or_connect(_host())
+
+    assert pool_lock_held == [False]
+    assert first is second
+    assert mgr._pool == {("nonexistent.invalid", 22, "ops"): first}
+
+
+def test_client_connected_during_close_is_not_pooled(monkeypatch: pytest.MonkeyPatch) -> None:
+    mgr = SSHManager(ClusterConfig())
+    closed: list[bool] = []
+
+    class _RacingClient(paramiko.SSHClient):
+        def connect(self, *_args: Any, **_kwargs: Any) -> None:  # type: ignore[override]
+            mgr._close_all()
+
+        def close(self) -> None:
+            closed.append(True)
+            super().close()
+
+    monkeypatch.setattr(mgr, "_build_client", _RacingClient)
+
+    with pytest.raises(SSHConnectionError, match="closed while connecting"):
+        mgr._get_or_connect(_host())
+
+    assert closed == [True]
+    assert mgr._pool == {}
+
+
+def test_private_key_is_parsed_once_per_file_version(tmp_path: Path) -> None:
+    mgr = SSHManager(ClusterConfig())
+    key_path = tmp_path / "id_rsa"
+    paramiko.RSAKey.generate(1024).write_private_key_file(str(key_path))
+
+    first = mgr._private_key(key_path)
+
+    assert first is not None
+    assert mgr._private_key(key_path) is first
+
+
+def test_private_key_is_reparsed_when_certificate_is_renewed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mgr = SSHManager(ClusterConfig())
+    key_path = tmp_path / "id_ed25519"
+    cert_path = tmp_path / "id_ed25519-cert.pub"
+    key_path.write_text("key", encoding="utf-8")
+    cert_path.write_text("cert-1", encoding="utf-8")
+    parsed: list[str] = []
+
+    def _from_path(path: Path) -> object:
+        del path
+        parsed.append(cert_path.read_text(encoding="utf-8"))
+        return object()
+
+    monkeypatch.setattr(paramiko.PKey, "from_path", staticmethod(_from_path))
+    first = mgr._private_key(key_path)
+    assert mgr._private_key(key_path) is first
+
+    cert_path.write_text("cert-2", encoding="utf-8")
+    stat = cert_path.stat()
+    os.utime(cert_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    renewed = mgr._private_key(key_path)
+
+    assert renewed is not first
+    assert parsed == ["cert-1", "cert-2"]
+
+
+def test_encrypted_private_key_is_left_to_paramiko(tmp_path: Path) -> None:
+    mgr = SSHManager(ClusterConfig())
+    key_path = tmp_path / "id_rsa"
+    key = paramiko.RSAKey.generate(1024)
+    key.write_private_key_file(str(key_path), password="fixture")  # noqa: S106
+
+    assert mgr._private_key(key_path) is None
+    assert mgr._private_key(tmp_path / "missing") is None
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import os
 
-from linuxagent.graph.checkpoint import _write_temp_checkpoint
+from langgraph.checkpoint.base import empty_checkpoint
+
+from linuxagent.graph.checkpoint import PersistentMemorySaver, _write_temp_checkpoint
 
 
 def test_write_temp_checkpoint_uses_unique_sibling_file(tmp_path) -> None:
@@ -22,3 +24,57 @@ def test_write_temp_checkpoint_uses_unique_sibling_file(tmp_path) -> None:
 
     os.replace(first, path)
     os.replace(second, path)
+
+
+def test_checkpoint_saver_journals_updates_and_replays_them(tmp_path) -> None:
+    path = tmp_path / "checkpoints.json"
+    saver = PersistentMemorySaver(path)
+    config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+    first = saver.put(config, empty_checkpoint(), {"step": 0}, {})
+    base_text = path.read_text(encoding="utf-8")
+
+    latest = empty_checkpoint()
+    saved = saver.put(first, latest, {"step": 1}, {})
+    saver.put_writes(saved, [("messages", "hello")], task_id="task-1")
+
+    assert path.read_text(encoding="utf-8") == base_text
+    assert saver.journal_path.stat().st_mode & 0o777 == 0o600
+    reloaded = PersistentMemorySaver(path)
+    restored = reloaded.get_tuple({"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}})
+    assert restored is not None
+    assert restored.checkpoint["id"] == latest["id"]
+    assert restored.pending_writes == [("task-1", "messages", "hello")]
+
+
+def test_checkpoint_saver_skips_malformed_journal_entries(tmp_path) -> None:
+    path = tmp_path / "checkpoints.json"
+    saver = PersistentMemorySaver(path)
+    config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+    first = saver.put(config, empty_checkpoint(), {"step": 0}, {})
+    latest = empty_checkpoint()
+    saver.put(first, latest, {"step": 1}, {})
+    with saver.journal_path.open("a", encoding="utf-8") as file:
+        file.write('{"storage":[{"thread_id":"thread-1"}]}\n')
+        file.write('{"writes":[["not", "a", "row"]]}\n')
+        file.write('{"blobs":[{"thread_id":"t","checkpoint_ns":"","channel":"c"}]}\n')
+        file.write("not json\n")
+
+    reloaded = PersistentMemorySaver(path)
+
+    restored = reloaded.get_tuple(config)
+    assert restored is not None
+    assert restored.checkpoint["id"] == latest["id"]
+
+
+def test_checkpoint_saver_compacts_journal_on_thread_delete(tmp_path) -> None:
+    path = tmp_path / "checkpoints.json"
+    saver = PersistentMemorySaver(path)
+    config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+    first = saver.put(config, empty_checkpoint(), {"step": 0}, {})
+    saver.put(first, empty_checkpoint(), {"step": 1}, {})
+
+    saver.delete_thread("thread-1")
+
+    assert not saver.journal_path.exists()
+    reloaded = PersistentMemorySaver(path)
+    assert reloaded.get_tuple(config) is None
@@ -26,9 +26,11 @@ from linuxagent.services import (
     JobDaemonUnavailableError,
     JobStatus,
     MonitoringService,
+    background_jobs,
     evaluate_alerts,
 )
 from linuxagent.services.background_jobs import (
+    JOB_OUTPUT_LIMIT,
     JOBS_STORE_VERSION,
     pruned_job_snapshots,
     snapshot_to_record,
@@ -84,6 +86,18 @@ def test_chat_service_saves_history_with_0600(tmp_path) -> None:
     assert "two" in loaded.export_markdown()
 
 
+def test_chat_service_save_tightens_existing_history_permissions(tmp_path) -> None:
+    path = tmp_path / "history.json"
+    path.write_text("stale history that is much longer than the new payload", encoding="utf-8")
+    path.chmod(0o644)
+    service = ChatService(path, max_messages=5)
+    service.add([HumanMessage(content="one")])
+    service.save()
+
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == 2
+
+
 def test_chat_service_saves_named_resume_sessions(tmp_path) -> None:
     path = tmp_path / "history.json"
     service = ChatService(path, max_messages=10)
@@ -108,6 +122,27 @@ def test_chat_service_saves_named_resume_sessions(tmp_path) -> None:
     ]
 
 
+def test_chat_service_journals_single_session_saves(tmp_path) -> None:
+    path = tmp_path / "history.json"
+    service = ChatService(path, max_messages=10)
+    service.replace_session("thread-a", [HumanMessage(content="first")])
+    service.save()
+    base = path.read_bytes()
+    service.replace_session("thread-b", [HumanMessage(content="second")])
+    service.save_session("thread-b")
+
+    assert path.read_bytes() == base
+    assert service.journal_path.stat().st_mode & 0o777 == 0o600
+    loaded = ChatService(path, max_messages=10)
+    loaded.load()
+    assert [session.thread_id for session in loaded.list_sessions()] == ["thread-b", "thread-a"]
+    assert [message.content for message in loaded.snapshot("thread-b")] == ["second"]
+
+    loaded.save()
+
+    assert not loaded.journal_path.exists()
+
+
 def test_chat_service_persists_session_times_and_sorts_by_updated_at(tmp_path) -> None:
     path = tmp_path / "history.json"
     older = datetime(2026, 4, 29, 10, 0, tzinfo=UTC)
@@ -130,6 +165,28 @@ def test_chat_service_persists_session_times_and_sorts_by_updated_at(tmp_path) -
     assert sessions[0].updated_at == newer
 
 
+def test_chat_service_limits_sessions_to_latest_updates(tmp_path) -> None:
+    path = tmp_path / "history.json"
+    start = datetime(2026, 4, 29, 10, 0, tzinfo=UTC)
+    payload = {
+        "version": 2,
+        "sessions": [
+            _history_session("newest", "task", start + timedelta(hours=2)),
+            _history_session("oldest", "task", start),
+            _history_session("middle", "task", start + timedelta(hours=1)),
+        ],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    loaded = ChatService(path, max_messages=10)
+    loaded.load()
+
+    assert [session.thread_id for session in loaded.list_sessions(limit=2)] == [
+        "newest",
+        "middle",
+    ]
+
+
 def test_chat_service_migrates_undated_sessions_in_file_order(tmp_path) -> None:
     path = tmp_path / "history.json"
     payload = {
@@ -319,6 +376,56 @@ async def test_background_job_service_runs_and_captures_output() -> None:
     assert finished.artifact_paths == (str(report_path),)
 
 
+class _ChattyStreamingExecutor(_StreamingExecutor):
+    async def execute_streaming(self, command: str, *, on_stdout, on_stderr, timeout_seconds=None):
+        del on_stderr, timeout_seconds
+        for index in range(JOB_OUTPUT_LIMIT // 5):
+            await on_stdout(f"{index:09d}\n")
+        self.started.set()
+        return ExecutionResult(command, 0, "", "", 0.1)
+
+
+async def test_background_job_service_keeps_latest_output_within_limit() -> None:
+    executor = _ChattyStreamingExecutor()
+    service = BackgroundJobService(CommandService(executor))  # type: ignore[arg-type]
+
+    snapshot = await service.start("/bin/seq 3200", goal="print numbers")
+    await executor.started.wait()
+    await asyncio.sleep(0)
+    finished = service.get(snapshot.job_id)
+
+    assert finished is not None
+    assert finished.stdout.startswith("[truncated: kept latest job output]\n")
+    assert finished.stdout.endswith(f"{JOB_OUTPUT_LIMIT // 5 - 1:09d}\n")
+    assert len(finished.stdout) <= JOB_OUTPUT_LIMIT + 64
+
+
+async def test_background_job_service_coalesces_output_persistence(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    writes: list[int] = []
+    persist_jobs = background_jobs._persist_jobs
+
+    def _counting_persist(path: Path, snapshots: tuple[BackgroundJobSnapshot, ...]) -> None:
+        writes.append(len(snapshots))
+        persist_jobs(path, snapshots)
+
+    monkeypatch.setattr(background_jobs, "_persist_jobs", _counting_persist)
+    executor = _ChattyStreamingExecutor()
+    path = tmp_path / "jobs.json"
+    service = BackgroundJobService(CommandService(executor), path=path)  # type: ignore[arg-type]
+
+    snapshot = await service.start("/bin/seq 3200", goal="print numbers")
+    await executor.started.wait()
+    await asyncio.sleep(0)
+
+    assert len(writes) < 10
+    reloaded = BackgroundJobService(CommandService(executor), path=path)  # type: ignore[arg-type]
+    restored = reloaded.get(snapshot.job_id)
+    assert restored is not None
+    assert restored.stdout.endswith(f"{JOB_OUTPUT_LIMIT // 5 - 1:09d}\n")
+
+
 async def test_background_job_service_stops_running_job() -> None:
     executor = _StreamingExecutor()
     service = BackgroundJobService(CommandService(executor))  # type: ignore[arg-type]
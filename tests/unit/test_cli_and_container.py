@@ -653,6 +653,29 @@ def test_container_background_jobs_uses_local_service_when_daemon_is_disabled()
     assert container.background_jobs() is container.local_jobs()
 
 
+def test_container_learner_exit_flush_logs_save_errors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    registered: list[tuple[Any, tuple[Any, ...]]] = []
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(
+        container_module.atexit, "register", lambda func, *args: registered.append((func, args))
+    )
+    container = Container(AppConfig.model_validate({"telemetry": {"enabled": False}}))
+    learner = container.learner()
+    [(flush_at_exit, args)] = registered
+    assert args == (learner,)
+
+    def failing_flush() -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(learner, "flush", failing_flush)
+    with caplog.at_level(logging.WARNING, logger="linuxagent.container"):
+        flush_at_exit(*args)
+
+    assert "disk full" in caplog.text
+
+
 def test_container_builds_configured_sandbox_runner() -> None:
     local_cfg = AppConfig.model_validate({"sandbox": {"enabled": True, "runner": "local"}})
     bwrap_cfg = AppConfig.model_validate({"sandbox": {"enabled": True, "runner": "bubblewrap"}})
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from linuxagent.event_replay import RuntimeEventStore, TurnEventReplay
+from linuxagent.event_replay import MAX_REPLAY_EVENTS, RuntimeEventStore, TurnEventReplay
 from linuxagent.pending_request import (
     PendingRequestType,
     build_pending_request,
@@ -102,6 +102,16 @@ def test_runtime_event_store_redacts_replayed_event_payloads() -> None:
     assert "***redacted***" in str(snapshot.events)
 
 
+def test_turn_event_replay_keeps_latest_events_window() -> None:
+    replay = TurnEventReplay()
+    for index in range(MAX_REPLAY_EVENTS + 3):
+        replay = replay.append(_work_item(f"tool-{index}", WorkItemStatus.RUNNING, "run"))
+
+    assert len(replay.events) == MAX_REPLAY_EVENTS
+    assert replay.events[0].payload["item_id"] == "tool-3"
+    assert replay.events[-1].payload["item_id"] == f"tool-{MAX_REPLAY_EVENTS + 2}"
+
+
 def _work_item(item_id: str, status: WorkItemStatus, summary: str):
     item = RuntimeWorkItem(
         item_id=item_id,
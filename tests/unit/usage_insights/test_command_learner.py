@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from linuxagent.interfaces import ExecutionResult
 from linuxagent.usage_insights import CommandLearner
 
@@ -52,3 +54,49 @@ def test_command_learner_persists_sanitized_successful_method(tmp_path) -> None:
     assert "plain-secret" not in text
     assert "runtime-token" not in text
     assert "***redacted***" in text
+
+
+def test_command_learner_throttles_saves_until_flush(tmp_path) -> None:
+    path = tmp_path / "learner.json"
+    learner = CommandLearner(path)
+    learner.record("uptime", _result())
+    assert learner.save_if_due() is True
+
+    learner.record("uptime", _result())
+    assert learner.save_if_due() is False
+    learner.flush()
+
+    loaded = CommandLearner(path)
+    loaded.load()
+    stats = loaded.stats_for("uptime")
+    assert stats is not None
+    assert stats.count == 2
+
+
+def test_command_learner_defers_load_until_first_use(tmp_path) -> None:
+    path = tmp_path / "learner.json"
+    learner = CommandLearner(path)
+    learner.defer_load()
+    saved = {"df -h": {"count": 3, "success_count": 3, "total_duration": 0.3}}
+    path.write_text(json.dumps(saved), encoding="utf-8")
+
+    learner.record("df -h", _result())
+
+    stats = learner.stats_for("df -h")
+    assert stats is not None
+    assert stats.count == 4
+
+
+def test_command_learner_keeps_unreadable_deferred_state_intact(tmp_path) -> None:
+    path = tmp_path / "learner.json"
+    path.write_text("{not json", encoding="utf-8")
+    learner = CommandLearner(path)
+    learner.defer_load()
+
+    learner.record("uptime", _result())
+    learner.flush()
+
+    stats = learner.stats_for("uptime")
+    assert stats is not None
+    assert stats.count == 1
+    assert path.read_text(encoding="utf-8") == "{not json"
@@ -57,6 +57,27 @@ async def test_embedding_cache_uses_0600(tmp_path) -> None:
     assert all((path.stat().st_mode & 0o777) == 0o600 for path in files)
 
 
+def test_embedding_cache_serves_repeat_lookups_from_memory(tmp_path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    cache.set("disk", [1.0, 0.0, 0.0])
+    for path in tmp_path.glob("*.json"):
+        path.unlink()
+    assert cache.get("disk") == [1.0, 0.0, 0.0]
+    assert EmbeddingCache(tmp_path).get("disk") is None
+
+
+def test_embedding_cache_is_not_aliased_to_caller_lists(tmp_path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    embedding = [1.0, 0.0, 0.0]
+    cache.set("query", embedding)
+    embedding[0] = 9.0
+    returned = cache.get("query")
+    assert returned is not None
+    returned.append(5.0)
+
+    assert cache.get("query") == [1.0, 0.0, 0.0]
+
+
 async def test_recommendation_engine_uses_stats_and_similarity() -> None:
     learner = CommandLearner()
     learner.record("df -h", ExecutionResult("df -h", 0, "", "", 0.1))
@@ -74,6 +95,40 @@ async def test_knowledge_base_searches_documents() -> None:
     assert result[0].document.id == "disk"
 
 
+async def test_knowledge_base_returns_each_content_once() -> None:
+    kb = KnowledgeBase(NLPEnhancer(FakeEmbeddings()))
+    kb.add(KnowledgeDocument("disk", "Use df -h to inspect disk space", {"topic": "disk"}))
+    kb.add(KnowledgeDocument("disk-copy", "Use df -h to inspect disk space", {"topic": "disk"}))
+    kb.add(KnowledgeDocument("proc", "Use ps aux to inspect processes", {"topic": "process"}))
+    result = await kb.search("disk usage", k=3)
+    assert [hit.document.id for hit in result] == ["disk", "proc"]
+
+
+async def test_knowledge_base_reuses_results_until_documents_change() -> None:
+    embeddings = _CountingEmbeddings()
+    kb = KnowledgeBase(NLPEnhancer(embeddings))
+    kb.add(KnowledgeDocument("proc", "Use ps aux to inspect processes", {"topic": "process"}))
+    first = await kb.search("disk usage", k=1)
+    again = await kb.search("disk usage", k=1)
+
+    assert again == first
+    assert embeddings.query_calls == 1
+
+    kb.add(KnowledgeDocument("disk", "Use df -h to inspect disk space", {"topic": "disk"}))
+    result = await kb.search("disk usage", k=1)
+
+    assert result[0].document.id == "disk"
+
+
+class _CountingEmbeddings(FakeEmbeddings):
+    def __init__(self) -> None:
+        self.query_calls = 0
+
+    async def aembed_query(self, text: str) -> list[float]:
+        self.query_calls += 1
+        return await super().aembed_query(text)
+
+
 def test_pattern_analyzer_flags_command_shape() -> None:
     result = PatternAnalyzer().analyze("python script.py")
     assert result.executable == "python"